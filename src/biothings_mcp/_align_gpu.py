@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Optional CUDA (cupy) backend for pairwise alignment of long sequences.
+
+Fills the Gotoh H/E/F matrices on the GPU by sweeping antidiagonals: cells on
+one antidiagonal have no mutual dependencies, so each wavefront updates in a
+single batch of vectorized device operations. The traceback walks the copied
+matrices on the host (O(n + m)).
+
+The module degrades gracefully: CUDA_AVAILABLE is False when cupy or a CUDA
+device is missing, and download_api routes those requests to the CPU backends.
+"""
+
+import numpy as np
+
+try:
+    import cupy as cp
+    CUDA_AVAILABLE = cp.cuda.runtime.getDeviceCount() > 0
+except Exception:
+    cp = None
+    CUDA_AVAILABLE = False
+
+# Above this cell count the three float32 DP matrices stop fitting comfortably
+# in device memory; callers should stay on the CPU backends instead.
+MAX_GPU_CELLS = int(2e8)
+
+_NEG_INF = np.float32(-1e30)
+
+
+def _fill_matrices(a, b, match, mismatch, gap_open, gap_extend, local):
+    """Run the wavefront DP on the device and return host copies of H/E/F."""
+    n = a.shape[0]
+    m = b.shape[0]
+    da = cp.asarray(a)
+    db = cp.asarray(b)
+
+    H = cp.zeros((n + 1, m + 1), dtype=cp.float32)
+    E = cp.full((n + 1, m + 1), _NEG_INF, dtype=cp.float32)
+    F = cp.full((n + 1, m + 1), _NEG_INF, dtype=cp.float32)
+
+    if not local:
+        border_i = cp.arange(1, n + 1, dtype=cp.float32)
+        H[1:, 0] = gap_open + (border_i - 1) * gap_extend
+        F[1:, 0] = H[1:, 0]
+        border_j = cp.arange(1, m + 1, dtype=cp.float32)
+        H[0, 1:] = gap_open + (border_j - 1) * gap_extend
+        E[0, 1:] = H[0, 1:]
+
+    for d in range(2, n + m + 1):
+        lo = max(1, d - m)
+        hi = min(n, d - 1)
+        if lo > hi:
+            continue
+        i = cp.arange(lo, hi + 1)
+        j = d - i
+        sub = cp.where(da[i - 1] == db[j - 1], np.float32(match), np.float32(mismatch))
+        e = cp.maximum(H[i, j - 1] + gap_open, E[i, j - 1] + gap_extend)
+        f = cp.maximum(H[i - 1, j] + gap_open, F[i - 1, j] + gap_extend)
+        h = cp.maximum(H[i - 1, j - 1] + sub, cp.maximum(e, f))
+        if local:
+            h = cp.maximum(h, np.float32(0.0))
+        E[i, j] = e
+        F[i, j] = f
+        H[i, j] = h
+
+    return cp.asnumpy(H), cp.asnumpy(E), cp.asnumpy(F)
+
+
+def _traceback(a, b, H, E, F, match, mismatch, gap_extend, local, start_i, start_j):
+    """Reconstruct the alignment from the host copies of the DP matrices."""
+    out_a = bytearray()
+    out_b = bytearray()
+    i, j = start_i, start_j
+    state = 0  # 0 = H, 1 = E (gap in a), 2 = F (gap in b)
+    gap = ord("-")
+    while i > 0 or j > 0:
+        if state == 0:
+            if local and H[i, j] == 0.0:
+                break
+            if i == 0:
+                state = 1
+            elif j == 0:
+                state = 2
+            else:
+                s = match if a[i - 1] == b[j - 1] else mismatch
+                if H[i, j] == np.float32(H[i - 1, j - 1] + np.float32(s)):
+                    out_a.append(a[i - 1])
+                    out_b.append(b[j - 1])
+                    i -= 1
+                    j -= 1
+                elif H[i, j] == F[i, j]:
+                    state = 2
+                else:
+                    state = 1
+        elif state == 1:
+            out_a.append(gap)
+            out_b.append(b[j - 1])
+            if not (j > 1 and E[i, j] == np.float32(E[i, j - 1] + np.float32(gap_extend))):
+                state = 0
+            j -= 1
+        else:
+            out_a.append(a[i - 1])
+            out_b.append(gap)
+            if not (i > 1 and F[i, j] == np.float32(F[i - 1, j] + np.float32(gap_extend))):
+                state = 0
+            i -= 1
+    out_a.reverse()
+    out_b.reverse()
+    return out_a.decode("ascii"), out_b.decode("ascii")
+
+
+def gotoh_align_gpu(
+    sequence1,
+    sequence2,
+    match: float,
+    mismatch: float,
+    gap_open: float,
+    gap_extend: float,
+    mode: str,
+) -> tuple:
+    """Align two ASCII sequences (str or bytes) on the GPU.
+
+    Returns (score, aligned_sequence1, aligned_sequence2), matching the
+    gotoh_align contract from _align_numba.
+
+    Raises:
+        RuntimeError: If CUDA is unavailable or the DP matrices would not fit
+    """
+    if not CUDA_AVAILABLE:
+        raise RuntimeError("No CUDA device available for GPU alignment")
+    if isinstance(sequence1, str):
+        sequence1 = sequence1.encode("ascii")
+    if isinstance(sequence2, str):
+        sequence2 = sequence2.encode("ascii")
+    a = np.frombuffer(sequence1, dtype=np.uint8)
+    b = np.frombuffer(sequence2, dtype=np.uint8)
+    if a.shape[0] * b.shape[0] > MAX_GPU_CELLS:
+        raise RuntimeError("Sequence product exceeds GPU matrix budget")
+
+    local = mode == "local"
+    H, E, F = _fill_matrices(a, b, match, mismatch, gap_open, gap_extend, local)
+
+    if local:
+        start_i, start_j = np.unravel_index(np.argmax(H), H.shape)
+        score = float(H[start_i, start_j])
+    else:
+        start_i, start_j = a.shape[0], b.shape[0]
+        score = float(H[start_i, start_j])
+
+    aligned1, aligned2 = _traceback(a, b, H, E, F, match, mismatch, gap_extend, local, int(start_i), int(start_j))
+    return score, aligned1, aligned2
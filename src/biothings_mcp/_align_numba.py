@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""Numba-JIT'd Gotoh affine-gap pairwise alignment kernel.
+
+Used by download_api.run_pairwise_alignment as an in-process fallback when
+parasail is not installed. The dynamic-programming loop is compiled by numba
+over uint8-encoded sequences, avoiding per-cell Python object overhead.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so the module still imports without numba."""
+        def decorator(func):
+            return func
+        return decorator
+
+GLOBAL_MODE = 0
+LOCAL_MODE = 1
+
+_GAP = 45  # ord("-")
+_NEG_INF = -1e30
+
+# Below this length the row-sequential kernel wins: spawning threads per
+# antidiagonal costs more than the DP itself.
+_PARALLEL_MIN_LEN = 256
+
+
+@njit(cache=True, boundscheck=False, nogil=True)
+def _gotoh_traceback(a, b, H, E, F, match, mismatch, gap_extend, mode, best_i, best_j):
+    """Walk filled H/E/F matrices back from (best_i, best_j).
+
+    The explicit H/E/F state machine reconstructs gap runs correctly under
+    affine scoring. Returns (aligned_a, aligned_b) as uint8 arrays with
+    '-' (45) for gaps.
+    """
+    n = a.shape[0]
+    m = b.shape[0]
+    out_a = np.empty(n + m, dtype=np.uint8)
+    out_b = np.empty(n + m, dtype=np.uint8)
+    k = 0
+    i = best_i
+    j = best_j
+    state = 0  # 0 = H, 1 = E, 2 = F
+    while i > 0 or j > 0:
+        if state == 0:
+            if mode == LOCAL_MODE and H[i, j] == 0.0:
+                break
+            if i == 0:
+                state = 1
+            elif j == 0:
+                state = 2
+            else:
+                s = match if a[i - 1] == b[j - 1] else mismatch
+                if H[i, j] == H[i - 1, j - 1] + s:
+                    out_a[k] = a[i - 1]
+                    out_b[k] = b[j - 1]
+                    i -= 1
+                    j -= 1
+                    k += 1
+                elif H[i, j] == F[i, j]:
+                    state = 2
+                else:
+                    state = 1
+        elif state == 1:
+            out_a[k] = _GAP
+            out_b[k] = b[j - 1]
+            k += 1
+            if j > 1 and E[i, j] == E[i, j - 1] + gap_extend:
+                j -= 1
+            else:
+                j -= 1
+                state = 0
+        else:
+            out_a[k] = a[i - 1]
+            out_b[k] = _GAP
+            k += 1
+            if i > 1 and F[i, j] == F[i - 1, j] + gap_extend:
+                i -= 1
+            else:
+                i -= 1
+                state = 0
+
+    return out_a[:k][::-1].copy(), out_b[:k][::-1].copy()
+
+
+@njit(cache=True, boundscheck=False, nogil=True)
+def _gotoh_kernel(a, b, match, mismatch, gap_open, gap_extend, mode):
+    """Fill Gotoh H/E/F matrices and trace back the best alignment.
+
+    Implements affine-gap Needleman-Wunsch (mode=0) / Smith-Waterman (mode=1)
+    where a gap of length k costs gap_open + (k - 1) * gap_extend (penalties
+    are negative). Returns (score, aligned_a, aligned_b) with aligned
+    sequences as uint8 arrays containing '-' (45) for gaps.
+    """
+    n = a.shape[0]
+    m = b.shape[0]
+
+    H = np.zeros((n + 1, m + 1), dtype=np.float64)
+    E = np.full((n + 1, m + 1), _NEG_INF, dtype=np.float64)  # gap in a (horizontal)
+    F = np.full((n + 1, m + 1), _NEG_INF, dtype=np.float64)  # gap in b (vertical)
+
+    if mode == GLOBAL_MODE:
+        for i in range(1, n + 1):
+            H[i, 0] = gap_open + (i - 1) * gap_extend
+            F[i, 0] = H[i, 0]
+        for j in range(1, m + 1):
+            H[0, j] = gap_open + (j - 1) * gap_extend
+            E[0, j] = H[0, j]
+
+    best = 0.0
+    best_i = n
+    best_j = m
+    for i in range(1, n + 1):
+        ai = a[i - 1]
+        for j in range(1, m + 1):
+            s = match if ai == b[j - 1] else mismatch
+            e = max(H[i, j - 1] + gap_open, E[i, j - 1] + gap_extend)
+            f = max(H[i - 1, j] + gap_open, F[i - 1, j] + gap_extend)
+            h = max(H[i - 1, j - 1] + s, max(e, f))
+            if mode == LOCAL_MODE and h < 0.0:
+                h = 0.0
+            E[i, j] = e
+            F[i, j] = f
+            H[i, j] = h
+            if mode == LOCAL_MODE and h > best:
+                best = h
+                best_i = i
+                best_j = j
+
+    if mode == GLOBAL_MODE:
+        best = H[n, m]
+        best_i = n
+        best_j = m
+
+    out_a, out_b = _gotoh_traceback(a, b, H, E, F, match, mismatch, gap_extend, mode, best_i, best_j)
+    return best, out_a, out_b
+
+
+@njit(parallel=True, cache=True, boundscheck=False, nogil=True)
+def _gotoh_fill_parallel(a, b, match, mismatch, gap_open, gap_extend, mode):
+    """Fill the Gotoh H/E/F matrices sweeping antidiagonals in parallel.
+
+    Cells on one antidiagonal d = i + j have no mutual dependencies, so each
+    wavefront updates with prange across CPU threads. Worth it only for long
+    sequences (see _PARALLEL_MIN_LEN); the fused _gotoh_kernel stays faster
+    below that.
+    """
+    n = a.shape[0]
+    m = b.shape[0]
+
+    H = np.zeros((n + 1, m + 1), dtype=np.float64)
+    E = np.full((n + 1, m + 1), _NEG_INF, dtype=np.float64)
+    F = np.full((n + 1, m + 1), _NEG_INF, dtype=np.float64)
+
+    if mode == GLOBAL_MODE:
+        for i in range(1, n + 1):
+            H[i, 0] = gap_open + (i - 1) * gap_extend
+            F[i, 0] = H[i, 0]
+        for j in range(1, m + 1):
+            H[0, j] = gap_open + (j - 1) * gap_extend
+            E[0, j] = H[0, j]
+
+    for d in range(2, n + m + 1):
+        lo = max(1, d - m)
+        hi = min(n, d - 1)
+        for i in prange(lo, hi + 1):
+            j = d - i
+            s = match if a[i - 1] == b[j - 1] else mismatch
+            e = max(H[i, j - 1] + gap_open, E[i, j - 1] + gap_extend)
+            f = max(H[i - 1, j] + gap_open, F[i - 1, j] + gap_extend)
+            h = max(H[i - 1, j - 1] + s, max(e, f))
+            if mode == LOCAL_MODE and h < 0.0:
+                h = 0.0
+            E[i, j] = e
+            F[i, j] = f
+            H[i, j] = h
+
+    return H, E, F
+
+
+def gotoh_align(
+    sequence1,
+    sequence2,
+    match: float,
+    mismatch: float,
+    gap_open: float,
+    gap_extend: float,
+    mode: str,
+) -> tuple:
+    """Align two ASCII sequences (str or bytes) with the JIT'd Gotoh kernel.
+
+    Accepting bytes lets callers encode once and avoid a redundant
+    str -> bytes round-trip. Returns (score, aligned_sequence1,
+    aligned_sequence2) with aligned sequences as strings containing '-'
+    for gaps.
+    """
+    if isinstance(sequence1, str):
+        sequence1 = sequence1.encode("ascii")
+    if isinstance(sequence2, str):
+        sequence2 = sequence2.encode("ascii")
+    a = np.frombuffer(sequence1, dtype=np.uint8)
+    b = np.frombuffer(sequence2, dtype=np.uint8)
+    mode_code = LOCAL_MODE if mode == "local" else GLOBAL_MODE
+    if NUMBA_AVAILABLE and min(a.shape[0], b.shape[0]) >= _PARALLEL_MIN_LEN:
+        H, E, F = _gotoh_fill_parallel(a, b, match, mismatch, gap_open, gap_extend, mode_code)
+        if mode_code == LOCAL_MODE:
+            best_i, best_j = np.unravel_index(np.argmax(H), H.shape)
+            score = H[best_i, best_j]
+        else:
+            best_i, best_j = a.shape[0], b.shape[0]
+            score = H[best_i, best_j]
+        out_a, out_b = _gotoh_traceback(
+            a, b, H, E, F, match, mismatch, gap_extend, mode_code, int(best_i), int(best_j)
+        )
+    else:
+        score, out_a, out_b = _gotoh_kernel(a, b, match, mismatch, gap_open, gap_extend, mode_code)
+    return float(score), out_a.tobytes().decode("ascii"), out_b.tobytes().decode("ascii")
+
+
+if NUMBA_AVAILABLE:
+    # Warm the JIT once at import so the first real request doesn't pay
+    # the compilation cost; the second call is long enough to trigger the
+    # parallel wavefront kernel.
+    gotoh_align("ACGT", "ACGT", 2.0, -1.0, -10.0, -0.5, "global")
+    gotoh_align("ACGT" * 64, "ACGT" * 64, 2.0, -1.0, -10.0, -0.5, "global")
@@ -4,12 +4,12 @@
 import logging
 from typing import Optional, List, Dict, Any, Union
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter, ValidationError
 from biothings_typed_client.genes import GeneClientAsync, GeneResponse
 from biothings_typed_client.variants import VariantClientAsync, VariantResponse
 from biothings_typed_client.chem import ChemClientAsync, ChemResponse
 from biothings_typed_client.taxons import TaxonClientAsync, TaxonResponse as BaseClientTaxonResponse
-from eliot import start_action
+from biothings_mcp._trace import start_action
 
 from biothings_mcp.download_api import DownloadTools
 
@@ -159,6 +159,18 @@ class MetadataResponse(BaseModel):
     index: Optional[Dict[str, Any]] = None
     version: Optional[str] = None
 
+# Hit lists are validated in one pydantic-core dispatch instead of a
+# per-item model_validate loop; for size=1000 responses this removes the
+# Python-side schema walk from every hit.
+# BioThings APIs cap result pages at 1000 hits; clamping upfront keeps
+# pathological size values from ballooning payloads and validation work.
+MAX_QUERY_SIZE = 1000
+
+_GENE_HITS_ADAPTER = TypeAdapter(List[GeneResponse])
+_VARIANT_HITS_ADAPTER = TypeAdapter(List[VariantResponse])
+_CHEM_HITS_ADAPTER = TypeAdapter(List[ChemResponse])
+_TAXON_HITS_ADAPTER = TypeAdapter(List[TaxonResponse])
+
 # Tool Handlers for MCP
 class GeneTools:
     """Handler for gene-related MCP tools."""
@@ -166,6 +178,9 @@ class GeneTools:
     def __init__(self, mcp_server, prefix: str = ""):
         self.mcp_server = mcp_server
         self.prefix = prefix
+        # Long-lived client shared across requests: entering/exiting it per
+        # call closed the underlying HTTP session each time, paying a fresh
+        # TCP+TLS handshake on every request.
         self.gene_client = GeneClientAsync()
     
     async def query_genes(self, q: str, fields: Optional[str] = "all", size: int = 10, skip: int = 0, 
@@ -189,15 +204,19 @@ class GeneTools:
         Returns gene details including symbol, name, taxid, and entrezgene.
         """
         with start_action(action_type="query_genes", q=q, size=size) as action:
-            async with self.gene_client as client:
-                raw_result = await client.query(
-                    q=q, fields=fields, size=size, skip=skip, sort=sort, 
-                    species=species, email=email
-                )
+            size = max(1, min(size, MAX_QUERY_SIZE))
+            skip = max(0, skip)
+            client = self.gene_client
+            raw_result = await client.query(
+                q=q, fields=fields, size=size, skip=skip, sort=sort, 
+                species=species, email=email
+            )
             # Convert raw dict to QueryResponse model
             if isinstance(raw_result, dict):
-                result = QueryResponse(
-                    hits=[GeneResponse.model_validate(hit) for hit in raw_result.get('hits', [])],
+                # model_construct: hits are already validated by the adapter and
+                # total/max_score/took are plain scalars from the API envelope.
+                result = QueryResponse.model_construct(
+                    hits=_GENE_HITS_ADAPTER.validate_python(raw_result.get('hits', [])),
                     total=raw_result.get('total'),
                     max_score=raw_result.get('max_score'), 
                     took=raw_result.get('took')
@@ -222,21 +241,27 @@ class GeneTools:
         - Query mixed IDs/symbols: `query_list=CDK2,672` with `scopes=symbol,entrezgene`
         """
         with start_action(action_type="query_many_genes", query_list=query_list) as action:
-            async with self.gene_client as client:
-                raw_result = await client.querymany(
-                    query_list=query_list.split(','), scopes=scopes, fields=fields,
-                    species=species, email=email, size=size
-                )
+            client = self.gene_client
+            raw_result = await client.querymany(
+                query_list=query_list.split(','), scopes=scopes, fields=fields,
+                species=species, email=email, size=size
+            )
             # Convert raw dicts to GeneResponse models, handling 'notfound' entries
             if isinstance(raw_result, list):
-                result = []
-                for item in raw_result:
-                    if isinstance(item, dict) and not item.get('notfound', False):
+                # Cheap dict-shape gate first, then one pydantic-core pass for
+                # the common all-valid case; the per-item loop (and its
+                # exception machinery) runs only when something is malformed.
+                candidates = [item for item in raw_result if isinstance(item, dict) and not item.get('notfound', False)]
+                try:
+                    result = _GENE_HITS_ADAPTER.validate_python(candidates)
+                except ValidationError:
+                    result = []
+                    for item in candidates:
                         try:
                             result.append(GeneResponse.model_validate(item))
-                        except Exception:
-                            # Skip invalid entries
+                        except ValidationError:
                             continue
+                    logger.warning("Skipped %d malformed entries in query_many_genes", len(candidates) - len(result))
             else:
                 result = raw_result
             action.add_success_fields(results_count=len(result))
@@ -255,10 +280,10 @@ class GeneTools:
         - Ensembl Gene ID: e.g., `ENSG00000123374`
         """
         with start_action(action_type="get_gene", gene_id=gene_id) as action:
-            async with self.gene_client as client:
-                result = await client.getgene(
-                    gene_id=gene_id, fields=fields, species=species, email=email
-                )
+            client = self.gene_client
+            result = await client.getgene(
+                gene_id=gene_id, fields=fields, species=species, email=email
+            )
             action.add_success_fields(gene_found=True)
             return result
     
@@ -274,10 +299,10 @@ class GeneTools:
         **Example:** `gene_ids=1017,1018` or `gene_ids=ENSG00000123374,ENSG00000134057`
         """
         with start_action(action_type="get_genes", gene_ids=gene_ids) as action:
-            async with self.gene_client as client:
-                result = await client.getgenes(
-                    gene_ids=gene_ids.split(','), fields=fields, species=species, email=email
-                )
+            client = self.gene_client
+            result = await client.getgenes(
+                gene_ids=gene_ids.split(','), fields=fields, species=species, email=email
+            )
             action.add_success_fields(genes_count=len(result))
             return result
     
@@ -295,8 +320,8 @@ class GeneTools:
         - `version`: Data version information
         """
         with start_action(action_type="get_gene_metadata") as action:
-            async with self.gene_client as client:
-                raw_result = await client.metadata()
+            client = self.gene_client
+            raw_result = await client.metadata()
             # Convert raw dict to MetadataResponse model
             if isinstance(raw_result, dict):
                 result = MetadataResponse(
@@ -344,6 +369,9 @@ class VariantTools:
     def __init__(self, mcp_server, prefix: str = ""):
         self.mcp_server = mcp_server
         self.prefix = prefix
+        # Long-lived client shared across requests: entering/exiting it per
+        # call closed the underlying HTTP session each time, paying a fresh
+        # TCP+TLS handshake on every request.
         self.variant_client = VariantClientAsync()
     
     async def query_variants(self, q: str, fields: Optional[str] = "all", size: int = 10, skip: int = 0,
@@ -363,14 +391,20 @@ class VariantTools:
         6. Genomic Interval Queries: `q=chr1:69000-70000`
         """
         with start_action(action_type="query_variants", q=q, size=size) as action:
-            async with self.variant_client as client:
-                raw_result = await client.query(
-                    q=q, fields=fields, size=size, skip=skip, sort=sort, email=email
-                )
+            # Bound pathological inputs before the upstream await: oversized
+            # pages would otherwise balloon the response and its validation.
+            size = max(1, min(size, MAX_QUERY_SIZE))
+            skip = max(0, skip)
+            client = self.variant_client
+            raw_result = await client.query(
+                q=q, fields=fields, size=size, skip=skip, sort=sort, email=email
+            )
             # Convert raw dict to VariantQueryResponse model
             if isinstance(raw_result, dict):
-                result = VariantQueryResponse(
-                    hits=[VariantResponse.model_validate(hit) for hit in raw_result.get('hits', [])],
+                # model_construct: hits are already validated by the adapter and
+                # total/max_score/took are plain scalars from the API envelope.
+                result = VariantQueryResponse.model_construct(
+                    hits=_VARIANT_HITS_ADAPTER.validate_python(raw_result.get('hits', [])),
                     total=raw_result.get('total'),
                     max_score=raw_result.get('max_score'),
                     took=raw_result.get('took')
@@ -393,20 +427,26 @@ class VariantTools:
         - Query mixed IDs: `query_list=rs58991260,chr1:g.69511A>G` with `scopes=dbsnp.rsid,_id`
         """
         with start_action(action_type="query_many_variants", query_list=query_list) as action:
-            async with self.variant_client as client:
-                raw_result = await client.querymany(
-                    query_list=query_list.split(','), scopes=scopes, fields=fields, email=email
-                )
+            client = self.variant_client
+            raw_result = await client.querymany(
+                query_list=query_list.split(','), scopes=scopes, fields=fields, email=email
+            )
             # Convert raw dicts to VariantResponse models, handling 'notfound' entries
             if isinstance(raw_result, list):
-                result = []
-                for item in raw_result:
-                    if isinstance(item, dict) and not item.get('notfound', False):
+                # Cheap dict-shape gate first, then one pydantic-core pass for
+                # the common all-valid case; the per-item loop (and its
+                # exception machinery) runs only when something is malformed.
+                candidates = [item for item in raw_result if isinstance(item, dict) and not item.get('notfound', False)]
+                try:
+                    result = _VARIANT_HITS_ADAPTER.validate_python(candidates)
+                except ValidationError:
+                    result = []
+                    for item in candidates:
                         try:
                             result.append(VariantResponse.model_validate(item))
-                        except Exception:
-                            # Skip invalid entries
+                        except ValidationError:
                             continue
+                    logger.warning("Skipped %d malformed entries in query_many_variants", len(candidates) - len(result))
             else:
                 result = raw_result
             action.add_success_fields(results_count=len(result))
@@ -424,20 +464,20 @@ class VariantTools:
         - dbSNP rsID (e.g., `rs58991260`)
         """
         with start_action(action_type="get_variant", variant_id=variant_id) as action:
-            async with self.variant_client as client:
-                # When requesting specific fields, we need to ensure required fields are included
-                if fields:
-                    # Add required fields for VariantResponse validation
-                    fields_list = fields.split(',') if isinstance(fields, str) else fields
-                    required_fields = ['_id', 'chrom', 'vcf.alt', 'vcf.position', 'vcf.ref']
-                    for req_field in required_fields:
-                        if req_field not in fields_list:
-                            fields_list.append(req_field)
-                    fields = ','.join(fields_list)
+            client = self.variant_client
+            # When requesting specific fields, we need to ensure required fields are included
+            if fields:
+                # Add required fields for VariantResponse validation
+                fields_list = fields.split(',') if isinstance(fields, str) else fields
+                required_fields = ['_id', 'chrom', 'vcf.alt', 'vcf.position', 'vcf.ref']
+                for req_field in required_fields:
+                    if req_field not in fields_list:
+                        fields_list.append(req_field)
+                fields = ','.join(fields_list)
                 
-                result = await client.getvariant(
-                    variant_id=variant_id, fields=fields, email=email
-                )
+            result = await client.getvariant(
+                variant_id=variant_id, fields=fields, email=email
+            )
             action.add_success_fields(variant_found=True)
             return result
     
@@ -452,10 +492,10 @@ class VariantTools:
         **Examples:** `variant_ids=chr7:g.140453134T>C,chr1:g.69511A>G` or `variant_ids=rs58991260,rs2500`
         """
         with start_action(action_type="get_variants", variant_ids=variant_ids) as action:
-            async with self.variant_client as client:
-                raw_result = await client.getvariants(
-                    variant_ids=variant_ids.split(','), fields=fields, email=email
-                )
+            client = self.variant_client
+            raw_result = await client.getvariants(
+                variant_ids=variant_ids.split(','), fields=fields, email=email
+            )
             # Filter out 'notfound' entries and convert to VariantResponse models
             result = []
             if isinstance(raw_result, list):
@@ -503,6 +543,9 @@ class ChemTools:
     def __init__(self, mcp_server, prefix: str = ""):
         self.mcp_server = mcp_server
         self.prefix = prefix
+        # Long-lived client shared across requests: entering/exiting it per
+        # call closed the underlying HTTP session each time, paying a fresh
+        # TCP+TLS handshake on every request.
         self.chem_client = ChemClientAsync()
     
     async def query_chems(self, q: str, fields: Optional[str] = "all", size: int = 10, skip: int = 0,
@@ -520,14 +563,20 @@ class ChemTools:
         Returns compound details including PubChem data like formula, weight, and XLogP.
         """
         with start_action(action_type="query_chems", q=q, size=size) as action:
-            async with self.chem_client as client:
-                raw_result = await client.query(
-                    q=q, fields=fields, size=size, skip=skip, sort=sort, email=email
-                )
+            # Bound pathological inputs before the upstream await: oversized
+            # pages would otherwise balloon the response and its validation.
+            size = max(1, min(size, MAX_QUERY_SIZE))
+            skip = max(0, skip)
+            client = self.chem_client
+            raw_result = await client.query(
+                q=q, fields=fields, size=size, skip=skip, sort=sort, email=email
+            )
             # Convert raw dict to ChemQueryResponse model
             if isinstance(raw_result, dict):
-                result = ChemQueryResponse(
-                    hits=[ChemResponse.model_validate(hit) for hit in raw_result.get('hits', [])],
+                # model_construct: hits are already validated by the adapter and
+                # total/max_score/took are plain scalars from the API envelope.
+                result = ChemQueryResponse.model_construct(
+                    hits=_CHEM_HITS_ADAPTER.validate_python(raw_result.get('hits', [])),
                     total=raw_result.get('total'),
                     max_score=raw_result.get('max_score'),
                     took=raw_result.get('took')
@@ -549,20 +598,26 @@ class ChemTools:
         3. Result Filtering: Return specific fields using fields parameter
         """
         with start_action(action_type="query_many_chems", query_list=query_list) as action:
-            async with self.chem_client as client:
-                raw_result = await client.querymany(
-                    query_list=query_list.split(','), scopes=scopes, fields=fields, email=email
-                )
+            client = self.chem_client
+            raw_result = await client.querymany(
+                query_list=query_list.split(','), scopes=scopes, fields=fields, email=email
+            )
             # Convert raw dicts to ChemResponse models, handling 'notfound' entries
             if isinstance(raw_result, list):
-                result = []
-                for item in raw_result:
-                    if isinstance(item, dict) and not item.get('notfound', False):
+                # Cheap dict-shape gate first, then one pydantic-core pass for
+                # the common all-valid case; the per-item loop (and its
+                # exception machinery) runs only when something is malformed.
+                candidates = [item for item in raw_result if isinstance(item, dict) and not item.get('notfound', False)]
+                try:
+                    result = _CHEM_HITS_ADAPTER.validate_python(candidates)
+                except ValidationError:
+                    result = []
+                    for item in candidates:
                         try:
                             result.append(ChemResponse.model_validate(item))
-                        except Exception:
-                            # Skip invalid entries
+                        except ValidationError:
                             continue
+                    logger.warning("Skipped %d malformed entries in query_many_chems", len(candidates) - len(result))
             else:
                 result = raw_result
             action.add_success_fields(results_count=len(result))
@@ -582,10 +637,10 @@ class ChemTools:
         chemical properties, stereochemistry information, and chemical identifiers.
         """
         with start_action(action_type="get_chem", chem_id=chem_id) as action:
-            async with self.chem_client as client:
-                result = await client.getchem(
-                    chem_id=chem_id, fields=fields, email=email
-                )
+            client = self.chem_client
+            result = await client.getchem(
+                chem_id=chem_id, fields=fields, email=email
+            )
             action.add_success_fields(chem_found=True)
             return result
     
@@ -600,10 +655,10 @@ class ChemTools:
         - Mixed formats: "KTUFNOKKBVMGRW-UHFFFAOYSA-N,5281"
         """
         with start_action(action_type="get_chems", chem_ids=chem_ids) as action:
-            async with self.chem_client as client:
-                result = await client.getchems(
-                    chem_ids=chem_ids.split(','), fields=fields, email=email
-                )
+            client = self.chem_client
+            result = await client.getchems(
+                chem_ids=chem_ids.split(','), fields=fields, email=email
+            )
             action.add_success_fields(chems_count=len(result))
             return result
     
@@ -636,6 +691,9 @@ class TaxonTools:
     def __init__(self, mcp_server, prefix: str = ""):
         self.mcp_server = mcp_server
         self.prefix = prefix
+        # Long-lived client shared across requests: entering/exiting it per
+        # call closed the underlying HTTP session each time, paying a fresh
+        # TCP+TLS handshake on every request.
         self.taxon_client = TaxonClientAsync()
     
     async def get_taxon(self, taxon_id: str, fields: str = "all", email: Optional[str] = None) -> TaxonResponse:
@@ -652,10 +710,10 @@ class TaxonTools:
         and gene data availability.
         """
         with start_action(action_type="get_taxon", taxon_id=taxon_id) as action:
-            async with self.taxon_client as client:
-                result = await client.gettaxon(
-                    taxon_id=taxon_id, fields=fields, email=email
-                )
+            client = self.taxon_client
+            result = await client.gettaxon(
+                taxon_id=taxon_id, fields=fields, email=email
+            )
             action.add_success_fields(taxon_found=True)
             return TaxonResponse.model_validate(result.model_dump(by_alias=True))
     
@@ -671,19 +729,19 @@ class TaxonTools:
         - Mixed IDs: "9606,Mus musculus" (Homo sapiens by NCBI ID and Mus musculus by name)
         """
         with start_action(action_type="get_taxons", taxon_ids=taxon_ids) as action:
-            async with self.taxon_client as client:
-                # Get individual taxons since gettaxons doesn't exist
-                taxon_id_list = taxon_ids.split(',')
-                results_from_client = []
-                for taxon_id in taxon_id_list:
-                    try:
-                        taxon_result = await client.gettaxon(
-                            taxon_id=taxon_id.strip(), fields=fields, email=email
-                        )
-                        results_from_client.append(taxon_result)
-                    except Exception:
-                        # Skip failed taxons
-                        continue
+            client = self.taxon_client
+            # Get individual taxons since gettaxons doesn't exist
+            taxon_id_list = taxon_ids.split(',')
+            results_from_client = []
+            for taxon_id in taxon_id_list:
+                try:
+                    taxon_result = await client.gettaxon(
+                        taxon_id=taxon_id.strip(), fields=fields, email=email
+                    )
+                    results_from_client.append(taxon_result)
+                except Exception:
+                    # Skip failed taxons
+                    continue
             # Convert each item to the local TaxonResponse model
             result = [TaxonResponse.model_validate(item.model_dump(by_alias=True)) for item in results_from_client]
             action.add_success_fields(taxons_count=len(result))
@@ -703,20 +761,32 @@ class TaxonTools:
         5. Wildcard Queries: "scientific_name:Homo*", "common_name:*mouse*"
         """
         with start_action(action_type="query_taxons", q=q, size=size) as action:
-            async with self.taxon_client as client:
-                result = await client.query(
-                    q=q, fields=fields, size=size, skip=skip, sort=sort, email=email
-                )
+            # Bound pathological inputs before the upstream await: oversized
+            # pages would otherwise balloon the response and its validation.
+            size = max(1, min(size, MAX_QUERY_SIZE))
+            skip = max(0, skip)
+            client = self.taxon_client
+            result = await client.query(
+                q=q, fields=fields, size=size, skip=skip, sort=sort, email=email
+            )
             validated_hits = []
             if isinstance(result, dict) and "hits" in result and isinstance(result["hits"], list):
-                for hit in result["hits"]:
-                    try:
-                        validated_hits.append(TaxonResponse.model_validate(hit))
-                    except Exception as e:
-                        logger.warning(f"Failed to validate taxon hit: {hit}, error: {e}")
-                        pass 
+                try:
+                    validated_hits = _TAXON_HITS_ADAPTER.validate_python(result["hits"])
+                except ValidationError:
+                    # Rare path: re-validate per item so bad hits are skipped
+                    # with a warning while good ones are kept.
+                    for hit in result["hits"]:
+                        try:
+                            validated_hits.append(TaxonResponse.model_validate(hit))
+                        except Exception as e:
+                            # Lazy %-formatting: the hit is only stringified when a handler
+                            # actually emits the record, not on every skipped hit.
+                            logger.warning("Failed to validate taxon hit: %r, error: %s", hit, e)
             
-            query_response = TaxonQueryResponse(
+            # model_construct: hits are already validated above and the envelope
+            # fields are plain scalars from the API response.
+            query_response = TaxonQueryResponse.model_construct(
                 hits=validated_hits,
                 total=result.get("total") if isinstance(result, dict) else None,
                 max_score=result.get("max_score") if isinstance(result, dict) else None,
@@ -740,12 +810,12 @@ class TaxonTools:
             fields_list = fields.split(',') if fields else None
             scopes_list = scopes.split(',') if scopes else None
             
-            async with self.taxon_client as client:
-                raw_results = await client.querymany(
-                    query_list.split(','),
-                    scopes=scopes_list, 
-                    fields=fields_list
-                )
+            client = self.taxon_client
+            raw_results = await client.querymany(
+                query_list.split(','),
+                scopes=scopes_list, 
+                fields=fields_list
+            )
             
             # Process results when returnall=False (default)
             results = []
@@ -755,7 +825,7 @@ class TaxonTools:
                         try:
                             results.append(TaxonResponse.model_validate(item))
                         except Exception as e:
-                            logger.warning(f"Failed to validate taxon item: {item}, error: {e}")
+                            logger.warning("Failed to validate taxon item: %r, error: %s", item, e)
             
             action.add_success_fields(results_count=len(results))
             return results
@@ -3,14 +3,38 @@
 
 import os
 import json
-import uuid
-from Bio import Entrez, SeqIO
-from Bio.Seq import Seq
+import asyncio
+import contextlib
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import httpx
+import requests
+from requests.adapters import HTTPAdapter, Retry
+from Bio import Align
 from pydantic import BaseModel, Field, ConfigDict
 from pathlib import Path
-from typing import Literal, List, Dict, Optional, Any
+from typing import IO, Literal, List, Dict, Optional, Any, Callable
 from urllib.error import HTTPError
-from eliot import start_action
+from biothings_mcp._trace import start_action
+
+try:
+    import parasail
+except ImportError:
+    parasail = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from biothings_mcp._align_numba import NUMBA_AVAILABLE, gotoh_align
+from biothings_mcp._align_gpu import CUDA_AVAILABLE, MAX_GPU_CELLS, gotoh_align_gpu
 
 DB_LITERAL = Literal[
     "pubmed", "protein", "nuccore", "ipg", "nucleotide", "structure", "genome",
@@ -36,109 +60,95 @@ class EntrezDownloadRequest(BaseModel):
         }
     }
 
+class PairwiseAlignmentRequest(BaseModel):
+    sequence1: str = Field(..., description="First sequence to align")
+    sequence2: str = Field(..., description="Second sequence to align")
+    mode: Literal["global", "local"] = Field("global", description="Alignment mode: 'global' (Needleman-Wunsch) or 'local' (Smith-Waterman)")
+    match_score: float = Field(2.0, description="Score for matching characters")
+    mismatch_penalty: float = Field(-1.0, description="Penalty for mismatching characters (negative)")
+    open_gap_penalty: float = Field(-10.0, description="Penalty for opening a gap (negative)")
+    extend_gap_penalty: float = Field(-0.5, description="Penalty for extending a gap (negative)")
+    accelerator: Literal["auto", "cpu", "gpu"] = Field("auto", description="Backend selection: 'auto' routes long sequences to the GPU when one is available, 'cpu'/'gpu' force a backend")
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "sequence1": "ACGTACGT",
+                "sequence2": "ACGTTCGT",
+                "mode": "global",
+            }
+        }
+    }
+
+class PairwiseAlignmentResponse(BaseModel):
+    score: float = Field(..., description="Alignment score")
+    aligned_sequence1: str = Field(..., description="First sequence with alignment gaps")
+    aligned_sequence2: str = Field(..., description="Second sequence with alignment gaps")
+    full_alignment_str: str = Field(..., description="Human-readable alignment block")
+    parameters_used: Dict[str, Any] = Field(..., description="Scoring parameters the alignment was computed with")
+
+    def report_chunks(self) -> List[bytes]:
+        """Pre-encoded pieces of the human-readable report.
+
+        A single dict walk over parameters_used produces the header lines;
+        callers can writelines() the chunks straight into a binary handle
+        without assembling (and later copying) one concatenated string.
+        """
+        params = self.parameters_used
+        return [
+            b"Pairwise Alignment Result\n",
+            f"Mode: {params['mode']}\n".encode(),
+            f"Match score: {params['match_score']}\n".encode(),
+            f"Mismatch penalty: {params['mismatch_penalty']}\n".encode(),
+            f"Open gap penalty: {params['open_gap_penalty']}\n".encode(),
+            f"Extend gap penalty: {params['extend_gap_penalty']}\n".encode(),
+            f"Score: {self.score}\n\n".encode(),
+            self.full_alignment_str.encode(),
+        ]
+
+    def to_report_text(self) -> str:
+        """Full report as one string, for callers that want it in memory."""
+        return b"".join(self.report_chunks()).decode()
+
+# Alphabet handled by the vectorized parasail backend; anything else
+# (protein, ambiguity codes) falls back to Biopython's PairwiseAligner.
+# Kept as a byte set so membership checks run on the already-encoded buffers.
+_PARASAIL_ALPHABET = frozenset(b"ACGTN")
+
+# Below this DP-cell count the kernel-launch and transfer overhead of the GPU
+# backend outweighs its throughput; 'auto' keeps such requests on the CPU.
+_GPU_MIN_CELLS = int(1e7)
+
+
+def _integral_scores(*values: float) -> bool:
+    """Whether every scoring parameter is a whole number.
+
+    parasail's 16-bit striped kernels take integer penalties, so fractional
+    parameters (including the default extend_gap_penalty of -0.5) would be
+    silently rounded — a -0.5 extension cost becomes 0. Such requests must
+    stay on the numba/Biopython backends, which score floats exactly.
+    """
+    return all(float(v).is_integer() for v in values)
+
 # Type hint for local file results
 LocalFileResult = Dict[Literal["path", "format", "success", "error"], Any]
 
-class DownloadTools:
-    """Handler for download-related MCP tools."""
-    
-    def __init__(self, mcp_server, prefix: str = "", output_dir: Optional[str] = None):
-        self.mcp_server = mcp_server
-        self.prefix = prefix
-        self.output_dir = Path(output_dir) if output_dir else Path.cwd() / "biothings_output"
-        
-        # Create output directory if it doesn't exist
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-    
-    def _save_to_local_file(
-        self, 
-        data: Any, 
-        format_type: str, 
-        output_path: Optional[str] = None,
-        default_prefix: str = "biothings_output"
-    ) -> LocalFileResult:
-        """Helper function to save data to local files.
-        
-        Args:
-            data: The data to save
-            format_type: File format ('fasta', 'gb', 'json', 'txt', etc.)
-            output_path: Full output path (absolute or relative) or None to auto-generate
-            default_prefix: Prefix for auto-generated filenames
-            
-        Returns:
-            LocalFileResult: Contains path, format, success status, and optional error information
-        """
-        # Map format types to file extensions
-        format_extensions = {
-            'fasta': '.fasta',
-            'gb': '.gb',
-            'json': '.json',
-            'txt': '.txt',
-            'tsv': '.tsv',
-            'alignment': '.aln'
-        }
-        
-        extension = format_extensions.get(format_type, '.txt')
-        
-        if output_path is None:
-            # Generate a unique filename in the default output directory
-            base_name = f"{default_prefix}_{str(uuid.uuid4())[:8]}"
-            file_path = self.output_dir / f"{base_name}{extension}"
-        else:
-            # Use the provided path
-            path_obj = Path(output_path)
-            if path_obj.is_absolute():
-                # Absolute path - use as is, but ensure it has the right extension
-                if path_obj.suffix != extension:
-                    file_path = path_obj.with_suffix(extension)
-                else:
-                    file_path = path_obj
-            else:
-                # Relative path - concatenate with output directory
-                if not str(output_path).endswith(extension):
-                    file_path = self.output_dir / f"{output_path}{extension}"
-                else:
-                    file_path = self.output_dir / output_path
-        
-        try:
-            if format_type in ['fasta', 'gb']:
-                # Write sequence data
-                with open(file_path, 'w') as f:
-                    f.write(str(data))
-            elif format_type == 'json':
-                with open(file_path, 'w') as f:
-                    json.dump(data, f, indent=2, default=str)
-            elif format_type == 'alignment':
-                # Write alignment data
-                with open(file_path, 'w') as f:
-                    f.write(str(data))
-            else:
-                # Default to text format
-                with open(file_path, 'w') as f:
-                    if isinstance(data, dict):
-                        json.dump(data, f, indent=2, default=str)
-                    else:
-                        f.write(str(data))
-                        
-            return {
-                "path": str(file_path),
-                "format": format_type,
-                "success": True
-            }
-        except Exception as e:
-            return {
-                "path": None,
-                "format": format_type,
-                "success": False,
-                "error": str(e)
-            }
-    
-    def register_tools(self):
-        """Register download-related MCP tools."""
-        
-        @self.mcp_server.tool(
-            name=f"{self.prefix}download_entrez_data",
-            description="""Download data from NCBI Entrez databases using Bio.Entrez.
+
+def _dump_json(data: Any, file_path: Path) -> None:
+    """Serialize data to a JSON file, preferring orjson's native encoder.
+
+    orjson emits indented bytes in a single C-level pass; the stdlib encoder
+    is kept as a fallback so the module still loads on restricted installs.
+    """
+    if orjson is not None:
+        file_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str))
+    else:
+        with open(file_path, 'w') as f:
+            json.dump(data, f, indent=2, default=str)
+
+# Tool descriptions are large static strings; defining them once at module
+# level keeps register_tools() lean and shares one object across instances.
+_DOWNLOAD_ENTREZ_DESCRIPTION = """Download data from NCBI Entrez databases using Bio.Entrez.
             
             Downloads data records from specified NCBI Entrez databases. This tool is designed to be called 
             by automated agents (like LLMs) or other services.
@@ -160,6 +170,10 @@ class DownloadTools:
                 - "fasta": Returns data in FASTA format.
                 - "gb": Returns data in GenBank format.
               Ensure the chosen `reftype` is compatible with the selected `db`.
+            - `max_workers` (int, optional): Maximum number of concurrent NCBI requests
+            - `batch_size` (int, optional): IDs fetched per efetch round trip
+              (default 200 per NCBI guidance); N IDs cost ~N/batch_size round trips
+              when the ID list is split into batches. Default 3 (NCBI's politeness cap).
 
             **Returns:**
             On success: Returns the downloaded data as a single raw string with the
@@ -174,23 +188,9 @@ class DownloadTools:
                 reftype="fasta"
             )
             ```
-            """)
-        def download_entrez_data(ids: List[str], db: DB_LITERAL, reftype: Literal["fasta", "gb"]) -> str:
-            with start_action(action_type="download_entrez_data", ids=ids, db=db, reftype=reftype) as action:
-                try:
-                    downloaded_content = get_entrez(ids=ids, db=db, reftype=reftype)
-                    action.add_success_fields(content_length=len(downloaded_content))
-                    return downloaded_content
-                except HTTPError as he:
-                    action.add_error_fields(error=f"NCBI Entrez Error ({he.code}): {he.reason}")
-                    raise ValueError(f"NCBI Entrez Error ({he.code}): {he.reason}") from he
-                except Exception as e:
-                    action.add_error_fields(error=f"Unexpected error during Entrez download: {str(e)}")
-                    raise ValueError(f"An unexpected error occurred during Entrez download: {str(e)}") from e
-        
-        @self.mcp_server.tool(
-            name=f"{self.prefix}download_entrez_data_local",
-            description="""Download data from NCBI Entrez databases and save to local file.
+            """
+
+_DOWNLOAD_ENTREZ_LOCAL_DESCRIPTION = """Download data from NCBI Entrez databases and save to local file.
             
             Same as download_entrez_data but saves the result to a local file instead of returning the content.
             This is useful for large downloads or when you want to persist the data.
@@ -199,7 +199,11 @@ class DownloadTools:
             - `ids` (List[str], required): A list of unique identifiers for the records to fetch
             - `db` (DB_LITERAL, required): The target NCBI Entrez database
             - `reftype` (Literal["fasta", "gb"], required): The desired format for the downloaded data
-            - `output_path` (Optional[str]): Custom output path. If None, generates unique filename
+            - `output_path` (Optional[str]): Custom output path. If None, generates unique filename.
+              A path ending in '.zst' implies compression.
+            - `compress` (bool): Stream the download through zstd compression
+              (level 3), writing a '.fasta.zst' / '.gb.zst' file. Recommended
+              for large multi-record downloads; requires the zstandard package.
             
             **Returns:**
             LocalFileResult containing:
@@ -217,24 +221,255 @@ class DownloadTools:
                 output_path="tp53_sequence.fasta"
             )
             ```
-            """)
-        def download_entrez_data_local(
+            """
+
+_CLEAR_ENTREZ_CACHE_DESCRIPTION = """Clear the cached NCBI Entrez responses.
+
+            Entrez downloads are cached in-process since records are immutable per
+            accession.version. This tool drops the cache, forcing subsequent
+            downloads to re-fetch from NCBI (mainly useful for debugging).
+
+            **Returns:**
+            Dict with `cleared_entries`: number of cached responses that were dropped.
+            """
+
+_ALIGNMENT_DESCRIPTION = """Perform a pairwise sequence alignment between two sequences.
+
+            Aligns two nucleotide or protein sequences using either global (Needleman-Wunsch)
+            or local (Smith-Waterman) alignment. Nucleotide sequences are aligned with a
+            SIMD-vectorized implementation (parasail) when available; other alphabets use
+            Biopython's PairwiseAligner.
+
+            **Parameters:**
+            - `sequence1` (str, required): First sequence to align
+            - `sequence2` (str, required): Second sequence to align
+            - `mode` (Literal["global", "local"]): Alignment mode. Default "global"
+            - `match_score` (float): Score for matching characters. Default 2.0
+            - `mismatch_penalty` (float): Penalty for mismatches (negative). Default -1.0
+            - `open_gap_penalty` (float): Penalty for opening a gap (negative). Default -10.0
+            - `extend_gap_penalty` (float): Penalty for extending a gap (negative). Default -0.5
+
+            **Returns:**
+            PairwiseAlignmentResponse containing the alignment score, both aligned
+            sequences (with gaps), a human-readable alignment block, and the scoring
+            parameters used.
+
+            **Example Usage:**
+            ```
+            perform_pairwise_alignment(
+                sequence1="ACGTACGT",
+                sequence2="ACGTTCGT",
+                mode="global"
+            )
+            ```
+            """
+
+_ALIGNMENT_MANY_DESCRIPTION = """Align one query sequence against many target sequences.
+
+            Same scoring model as perform_pairwise_alignment, but amortizes the
+            query profile across all targets: the substitution profile is built
+            once and reused for every target alignment, which is significantly
+            faster than repeated single-pair calls.
+
+            **Parameters:**
+            - `sequence1` (str, required): Query sequence aligned against every target
+            - `sequences2` (List[str], required): Target sequences
+            - Remaining scoring parameters as in perform_pairwise_alignment
+
+            **Returns:**
+            List[PairwiseAlignmentResponse], one per target, in input order.
+
+            **Example Usage:**
+            ```
+            perform_pairwise_alignment_many(
+                sequence1="ACGTACGT",
+                sequences2=["ACGTTCGT", "ACGTCGT"],
+                mode="local"
+            )
+            ```
+            """
+
+_ALIGNMENT_LOCAL_DESCRIPTION = """Perform a pairwise sequence alignment and save the result to a local file.
+
+            Same as perform_pairwise_alignment but saves a formatted alignment report to a
+            local file instead of returning the alignment content.
+
+            **Parameters:**
+            Same as perform_pairwise_alignment, plus:
+            - `output_path` (Optional[str]): Custom output path. If None, generates unique filename
+
+            **Returns:**
+            LocalFileResult containing:
+            - `path`: Path to the saved alignment file
+            - `format`: File format used ("alignment")
+            - `success`: Whether the operation succeeded
+            - `error`: Error message if failed
+            """
+
+
+class DownloadTools:
+    """Handler for download-related MCP tools."""
+
+    # Map format types to file extensions (shared across all saves)
+    _FORMAT_EXT = {
+        'fasta': '.fasta',
+        'gb': '.gb',
+        'json': '.json',
+        'txt': '.txt',
+        'tsv': '.tsv',
+        'alignment': '.aln'
+    }
+
+    def __init__(self, mcp_server, prefix: str = "", output_dir: Optional[str] = None):
+        self.mcp_server = mcp_server
+        self.prefix = prefix
+        self.output_dir = Path(output_dir) if output_dir else Path.cwd() / "biothings_output"
+        
+        # Create output directory if it doesn't exist
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+    
+    def _resolve_output_path(
+        self,
+        extension: str,
+        output_path: Optional[str] = None,
+        default_prefix: str = "biothings_output"
+    ) -> Path:
+        """Resolve the target file path for a save, enforcing the given extension.
+
+        Args:
+            extension: File extension including the leading dot (e.g. '.fasta')
+            output_path: Full output path (absolute or relative) or None to auto-generate
+            default_prefix: Prefix for auto-generated filenames
+
+        Returns:
+            Path: The resolved output file path
+        """
+        if output_path is None:
+            # Generate a unique filename in the default output directory
+            base_name = f"{default_prefix}_{os.urandom(4).hex()}"
+            return self.output_dir / f"{base_name}{extension}"
+
+        path_obj = Path(output_path)
+        if path_obj.is_absolute():
+            # Absolute path - use as is, but ensure it has the right extension.
+            # Compared with endswith so compound extensions like '.fasta.zst'
+            # are recognized (Path.suffix only sees the last component).
+            if not path_obj.name.endswith(extension):
+                return path_obj.with_suffix(extension)
+            return path_obj
+        # Relative path - concatenate with output directory
+        if not path_obj.name.endswith(extension):
+            return self.output_dir / f"{output_path}{extension}"
+        return self.output_dir / output_path
+
+    def _save_to_local_file(
+        self,
+        data: Any,
+        format_type: str,
+        output_path: Optional[str] = None,
+        default_prefix: str = "biothings_output",
+        writer: Optional[Callable[[IO[bytes]], None]] = None
+    ) -> LocalFileResult:
+        """Helper function to save data to local files.
+
+        Args:
+            data: The data to save (ignored when writer is given)
+            format_type: File format ('fasta', 'gb', 'json', 'txt', etc.)
+            output_path: Full output path (absolute or relative) or None to auto-generate
+            default_prefix: Prefix for auto-generated filenames
+            writer: Optional callable that writes directly into the opened
+                binary file handle, letting callers stream pieces without
+                first assembling one large payload string
+
+        Returns:
+            LocalFileResult: Contains path, format, success status, and optional error information
+        """
+        extension = self._FORMAT_EXT.get(format_type, '.txt')
+        file_path = self._resolve_output_path(extension, output_path, default_prefix)
+        # Convert to str once; open() would otherwise call __fspath__ per use,
+        # which adds up for agents writing many small per-record files.
+        path_str = os.fspath(file_path)
+
+        try:
+            if writer is not None:
+                with open(path_str, 'wb') as f:
+                    writer(f)
+            elif format_type in ['fasta', 'gb', 'alignment']:
+                # write_bytes issues one open/write/close round trip with no
+                # BufferedWriter/TextIOWrapper layering or newline translation.
+                file_path.write_bytes(data.encode('utf-8') if isinstance(data, str) else data)
+            elif format_type == 'json':
+                _dump_json(data, file_path)
+            else:
+                # Default to text format
+                if isinstance(data, dict):
+                    _dump_json(data, file_path)
+                else:
+                    file_path.write_bytes(str(data).encode('utf-8'))
+
+            return {
+                "path": path_str,
+                "format": format_type,
+                "success": True
+            }
+        except Exception as e:
+            return {
+                "path": None,
+                "format": format_type,
+                "success": False,
+                "error": str(e)
+            }
+    
+    def register_tools(self):
+        """Register download-related MCP tools."""
+        
+        @self.mcp_server.tool(
+            name=f"{self.prefix}download_entrez_data",
+            description=_DOWNLOAD_ENTREZ_DESCRIPTION)
+        async def download_entrez_data(ids: List[str], db: DB_LITERAL, reftype: Literal["fasta", "gb"], max_workers: int = ENTREZ_MAX_WORKERS, batch_size: int = ENTREZ_BATCH_SIZE) -> str:
+            with start_action(action_type="download_entrez_data", ids=ids, db=db, reftype=reftype) as action:
+                try:
+                    if len(ids) > batch_size:
+                        # Multi-chunk downloads gather natively on the event
+                        # loop; single-chunk requests keep the memoized path.
+                        downloaded_content = await get_entrez_async(ids, db=db, reftype=reftype, batch_size=batch_size, max_workers=max_workers)
+                    else:
+                        downloaded_content = await asyncio.to_thread(get_entrez, ids=ids, db=db, reftype=reftype, max_workers=max_workers, batch_size=batch_size)
+                    action.add_success_fields(content_length=len(downloaded_content))
+                    return downloaded_content
+                except HTTPError as he:
+                    action.add_error_fields(error=f"NCBI Entrez Error ({he.code}): {he.reason}")
+                    raise ValueError(f"NCBI Entrez Error ({he.code}): {he.reason}") from he
+                except Exception as e:
+                    action.add_error_fields(error=f"Unexpected error during Entrez download: {str(e)}")
+                    raise ValueError(f"An unexpected error occurred during Entrez download: {str(e)}") from e
+        
+        @self.mcp_server.tool(
+            name=f"{self.prefix}download_entrez_data_local",
+            description=_DOWNLOAD_ENTREZ_LOCAL_DESCRIPTION)
+        async def download_entrez_data_local(
             ids: List[str], 
             db: DB_LITERAL, 
             reftype: Literal["fasta", "gb"],
-            output_path: Optional[str] = None
+            output_path: Optional[str] = None,
+            compress: bool = False
         ) -> LocalFileResult:
             with start_action(action_type="download_entrez_data_local", ids=ids, db=db, reftype=reftype) as action:
                 try:
-                    downloaded_content = get_entrez(ids=ids, db=db, reftype=reftype)
-                    result = self._save_to_local_file(
-                        data=downloaded_content,
-                        format_type=reftype,
-                        output_path=output_path,
-                        default_prefix=f"entrez_{db}"
-                    )
+                    # Stream straight from the HTTP response to disk; the payload
+                    # is never held in memory as a whole.
+                    if output_path is not None and output_path.endswith(".zst"):
+                        compress = True
+                    extension = f".{reftype}.zst" if compress else f".{reftype}"
+                    file_path = self._resolve_output_path(extension, output_path, f"entrez_{db}")
+                    bytes_written = await _stream_entrez_to_file_async(ids=ids, db=db, reftype=reftype, file_path=file_path, compress=compress)
+                    result: LocalFileResult = {
+                        "path": str(file_path),
+                        "format": f"{reftype}.zst" if compress else reftype,
+                        "success": True
+                    }
                     action.add_success_fields(
-                        content_length=len(downloaded_content),
+                        content_length=bytes_written,
                         saved_to=result.get("path"),
                         success=result.get("success")
                     )
@@ -255,43 +490,765 @@ class DownloadTools:
                         "success": False,
                         "error": f"An unexpected error occurred during Entrez download: {str(e)}"
                     }
-      
 
-def get_entrez(ids: List[str], db: DB_LITERAL, reftype: Literal["fasta", "gb"]) -> str:
+        @self.mcp_server.tool(
+            name=f"{self.prefix}clear_entrez_cache",
+            description=_CLEAR_ENTREZ_CACHE_DESCRIPTION)
+        def clear_entrez_cache_tool() -> Dict[str, Any]:
+            with start_action(action_type="clear_entrez_cache") as action:
+                cache_info = _get_entrez_cached.cache_info()
+                clear_entrez_cache()
+                action.add_success_fields(cleared_entries=cache_info.currsize)
+                return {"cleared_entries": cache_info.currsize}
+
+        @self.mcp_server.tool(
+            name=f"{self.prefix}perform_pairwise_alignment",
+            description=_ALIGNMENT_DESCRIPTION)
+        async def perform_pairwise_alignment(
+            sequence1: str,
+            sequence2: str,
+            mode: Literal["global", "local"] = "global",
+            match_score: float = 2.0,
+            mismatch_penalty: float = -1.0,
+            open_gap_penalty: float = -10.0,
+            extend_gap_penalty: float = -0.5,
+            accelerator: Literal["auto", "cpu", "gpu"] = "auto"
+        ) -> PairwiseAlignmentResponse:
+            with start_action(action_type="perform_pairwise_alignment", mode=mode) as action:
+                try:
+                    # Arguments were already validated against the tool schema;
+                    # model_construct skips a redundant second Pydantic pass.
+                    request = PairwiseAlignmentRequest.model_construct(
+                        sequence1=sequence1,
+                        sequence2=sequence2,
+                        mode=mode,
+                        match_score=match_score,
+                        mismatch_penalty=mismatch_penalty,
+                        open_gap_penalty=open_gap_penalty,
+                        extend_gap_penalty=extend_gap_penalty,
+                        accelerator=accelerator
+                    )
+                    response = await asyncio.to_thread(run_pairwise_alignment, request)
+                    action.add_success_fields(score=response.score)
+                    return response
+                except Exception as e:
+                    action.add_error_fields(error=f"Unexpected error during pairwise alignment: {str(e)}")
+                    raise ValueError(f"An unexpected error occurred during pairwise alignment: {str(e)}") from e
+
+        @self.mcp_server.tool(
+            name=f"{self.prefix}perform_pairwise_alignment_many",
+            description=_ALIGNMENT_MANY_DESCRIPTION)
+        async def perform_pairwise_alignment_many(
+            sequence1: str,
+            sequences2: List[str],
+            mode: Literal["global", "local"] = "global",
+            match_score: float = 2.0,
+            mismatch_penalty: float = -1.0,
+            open_gap_penalty: float = -10.0,
+            extend_gap_penalty: float = -0.5
+        ) -> List[PairwiseAlignmentResponse]:
+            with start_action(action_type="perform_pairwise_alignment_many", mode=mode, targets=len(sequences2)) as action:
+                try:
+                    responses = await asyncio.to_thread(
+                        run_pairwise_alignment_many,
+                        sequence1=sequence1,
+                        sequences2=sequences2,
+                        mode=mode,
+                        match_score=match_score,
+                        mismatch_penalty=mismatch_penalty,
+                        open_gap_penalty=open_gap_penalty,
+                        extend_gap_penalty=extend_gap_penalty
+                    )
+                    action.add_success_fields(alignments_count=len(responses))
+                    return responses
+                except Exception as e:
+                    action.add_error_fields(error=f"Unexpected error during pairwise alignment: {str(e)}")
+                    raise ValueError(f"An unexpected error occurred during pairwise alignment: {str(e)}") from e
+
+        @self.mcp_server.tool(
+            name=f"{self.prefix}perform_pairwise_alignment_local",
+            description=_ALIGNMENT_LOCAL_DESCRIPTION)
+        async def perform_pairwise_alignment_local(
+            sequence1: str,
+            sequence2: str,
+            mode: Literal["global", "local"] = "global",
+            match_score: float = 2.0,
+            mismatch_penalty: float = -1.0,
+            open_gap_penalty: float = -10.0,
+            extend_gap_penalty: float = -0.5,
+            accelerator: Literal["auto", "cpu", "gpu"] = "auto",
+            output_path: Optional[str] = None
+        ) -> LocalFileResult:
+            with start_action(action_type="perform_pairwise_alignment_local", mode=mode) as action:
+                try:
+                    # Arguments were already validated against the tool schema;
+                    # model_construct skips a redundant second Pydantic pass.
+                    request = PairwiseAlignmentRequest.model_construct(
+                        sequence1=sequence1,
+                        sequence2=sequence2,
+                        mode=mode,
+                        match_score=match_score,
+                        mismatch_penalty=mismatch_penalty,
+                        open_gap_penalty=open_gap_penalty,
+                        extend_gap_penalty=extend_gap_penalty,
+                        accelerator=accelerator
+                    )
+                    response = await asyncio.to_thread(run_pairwise_alignment, request)
+                    # writelines streams the report pieces straight into the
+                    # file handle; the (potentially large) full_alignment_str
+                    # is never copied into one concatenated report string.
+                    report_lines = response.report_chunks()
+                    result = self._save_to_local_file(
+                        data=None,
+                        format_type="alignment",
+                        output_path=output_path,
+                        default_prefix="pairwise_alignment",
+                        writer=lambda f: f.writelines(report_lines)
+                    )
+                    action.add_success_fields(
+                        score=response.score,
+                        saved_to=result.get("path"),
+                        success=result.get("success")
+                    )
+                    return result
+                except Exception as e:
+                    action.add_error_fields(error=f"Unexpected error during pairwise alignment: {str(e)}")
+                    return {
+                        "path": None,
+                        "format": "alignment",
+                        "success": False,
+                        "error": f"An unexpected error occurred during pairwise alignment: {str(e)}"
+                    }
+
+
+# Entrez identity is resolved once at import instead of per call. With an
+# API key NCBI raises the politeness ceiling from 3 to 10 requests/second,
+# so the semaphore and worker cap scale accordingly.
+ENTREZ_EMAIL = os.getenv("ENTREZ_EMAIL")
+NCBI_API_KEY = os.getenv("NCBI_API_KEY")
+ENTREZ_TOOL = "biothings-mcp"
+
+ENTREZ_BATCH_SIZE = 200
+ENTREZ_MAX_WORKERS = 10 if NCBI_API_KEY else 3
+_entrez_semaphore = threading.Semaphore(ENTREZ_MAX_WORKERS)
+
+EUTILS_EFETCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
+
+
+def _entrez_params(chunk_ids: List[str], db: DB_LITERAL, reftype: Literal["fasta", "gb"], email: str) -> Dict[str, str]:
+    """Build the efetch query parameters shared by every fetch path."""
+    params = {
+        "db": db,
+        "id": ",".join(chunk_ids),
+        "rettype": reftype,
+        "retmode": "text",
+        "email": email,
+        "tool": ENTREZ_TOOL,
+    }
+    if NCBI_API_KEY:
+        params["api_key"] = NCBI_API_KEY
+    return params
+
+# Entrez records are immutable per accession.version, so repeated fetches of
+# the same IDs (common in agent workflows) can be served from cache.
+ENTREZ_CACHE_SIZE = int(os.getenv("ENTREZ_CACHE_SIZE", "512"))
+ENTREZ_REDIS_TTL = 86400
+ENTREZ_DISK_TTL = 86400 * 30
+
+# Optional on-disk cache: set BIOTHINGS_CACHE_DIR (and install diskcache) to
+# persist fetches across process restarts; sits below the in-process LRU.
+_disk_cache = None
+if os.getenv("BIOTHINGS_CACHE_DIR"):
+    try:
+        import diskcache
+        _disk_cache = diskcache.Cache(os.environ["BIOTHINGS_CACHE_DIR"])
+    except ImportError:
+        _disk_cache = None
+
+# Optional shared cache: set REDIS_URL (and install redis) to cache fetches
+# across processes; otherwise an in-process LRU cache is used.
+_redis_client = None
+if os.getenv("REDIS_URL"):
+    try:
+        import redis
+        _redis_client = redis.Redis.from_url(os.environ["REDIS_URL"])
+    except ImportError:
+        _redis_client = None
+
+# Persistent session so consecutive efetch calls reuse TCP/TLS connections
+# instead of paying the handshake on every request.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+))
+
+# Shared async client for the native-async fetch path; created lazily so
+# importing the module never opens sockets. httpx ships with fastmcp, so it
+# is a hard dependency already.
+_ASYNC_CLIENT: Optional["httpx.AsyncClient"] = None
+_async_client_lock = threading.Lock()
+
+
+def _get_async_client() -> "httpx.AsyncClient":
+    global _ASYNC_CLIENT
+    if _ASYNC_CLIENT is None:
+        with _async_client_lock:
+            if _ASYNC_CLIENT is None:
+                _ASYNC_CLIENT = httpx.AsyncClient(
+                    timeout=60,
+                    limits=httpx.Limits(max_connections=10, max_keepalive_connections=4),
+                )
+    return _ASYNC_CLIENT
+
+
+async def get_entrez_async(ids: List[str], db: DB_LITERAL, reftype: Literal["fasta", "gb"], batch_size: int = ENTREZ_BATCH_SIZE, max_workers: int = ENTREZ_MAX_WORKERS) -> str:
+    """
+    Downloads data from NCBI Entrez databases without leaving the event loop.
+
+    Chunks are fetched concurrently with asyncio.gather over a shared
+    httpx.AsyncClient, bounded by an asyncio.Semaphore matching the NCBI
+    politeness cap. Unlike get_entrez, no worker threads are involved and no
+    response cache is consulted; the tool layer routes only large multi-chunk
+    downloads (which are rarely cache hits) through this path.
+
+    Args:
+        ids: List of unique identifiers for the records to fetch
+        db: The target NCBI Entrez database
+        reftype: The desired format for the downloaded data ("fasta" or "gb")
+        batch_size: Number of IDs coalesced into each efetch round trip
+        max_workers: Maximum number of chunk fetches in flight at once
+
+    Returns:
+        str: The downloaded data as a string, in input-ID order
+
+    Raises:
+        HTTPError: If NCBI returns an error
+        ValueError: If ENTREZ_EMAIL is not configured
+    """
+    email = ENTREZ_EMAIL or os.getenv("ENTREZ_EMAIL")
+    if not email:
+        raise ValueError("ENTREZ_EMAIL environment variable must be set for NCBI Entrez queries")
+
+    client = _get_async_client()
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def fetch_chunk(chunk: List[str]) -> str:
+        async with semaphore:
+            response = await client.get(EUTILS_EFETCH_URL, params=_entrez_params(chunk, db, reftype, email))
+        if response.status_code >= 400:
+            raise HTTPError(str(response.url), response.status_code, response.reason_phrase, response.headers, None)
+        return response.text
+
+    chunks = [ids[i:i + batch_size] for i in range(0, len(ids), batch_size)]
+    results = await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks))
+    return "".join(results)
+
+
+async def _stream_entrez_to_file_async(ids: List[str], db: DB_LITERAL, reftype: Literal["fasta", "gb"], file_path: Path, compress: bool = False) -> int:
+    """
+    Async counterpart of _stream_entrez_to_file using the shared httpx client.
+
+    Chunks stream from the HTTP response straight into the file via
+    aiter_bytes, so the payload is never held in memory as a whole and no
+    worker thread is parked on the download. Writes go to the page cache in
+    64 KiB pieces, so each one blocks the loop only momentarily.
+
+    Args:
+        ids: List of unique identifiers for the records to fetch
+        db: The target NCBI Entrez database
+        reftype: The desired format for the downloaded data ("fasta" or "gb")
+        file_path: Destination file
+        compress: Compress the output with zstd while streaming
+
+    Returns:
+        int: Number of uncompressed payload bytes received
+
+    Raises:
+        HTTPError: If NCBI returns an error
+        ValueError: If ENTREZ_EMAIL is not configured, or compression is
+            requested without the zstandard package installed
+    """
+    email = ENTREZ_EMAIL or os.getenv("ENTREZ_EMAIL")
+    if not email:
+        raise ValueError("ENTREZ_EMAIL environment variable must be set for NCBI Entrez queries")
+    if compress and zstandard is None:
+        raise ValueError("Compressed Entrez downloads require the 'zstandard' package")
+
+    client = _get_async_client()
+    chunks = [ids[i:i + ENTREZ_BATCH_SIZE] for i in range(0, len(ids), ENTREZ_BATCH_SIZE)]
+    bytes_written = 0
+    with open(file_path, 'wb') as raw:
+        sink = zstandard.ZstdCompressor(level=3).stream_writer(raw) if compress else contextlib.nullcontext(raw)
+        with sink as f:
+            # Chunks are fetched sequentially so records land in input order.
+            for chunk_ids in chunks:
+                async with client.stream("GET", EUTILS_EFETCH_URL, params=_entrez_params(chunk_ids, db, reftype, email)) as response:
+                    if response.status_code >= 400:
+                        raise HTTPError(str(response.url), response.status_code, response.reason_phrase, response.headers, None)
+                    async for data_chunk in response.aiter_bytes(65536):
+                        f.write(data_chunk)
+                        bytes_written += len(data_chunk)
+    return bytes_written
+
+
+def _fetch_entrez_chunk(chunk: List[str], db: DB_LITERAL, reftype: Literal["fasta", "gb"], email: str) -> str:
+    """Fetch a single chunk of IDs from the Entrez efetch endpoint."""
+    with _entrez_semaphore:
+        response = _SESSION.get(EUTILS_EFETCH_URL, params=_entrez_params(chunk, db, reftype, email), timeout=60)
+    if response.status_code >= 400:
+        # Keep the urllib HTTPError surface the tool handlers already catch
+        raise HTTPError(response.url, response.status_code, response.reason, response.headers, None)
+    return response.text
+
+
+def _stream_entrez_to_file(ids: List[str], db: DB_LITERAL, reftype: Literal["fasta", "gb"], file_path: Path, compress: bool = False) -> int:
+    """
+    Streams Entrez records directly into a local file.
+
+    Unlike get_entrez, the response is never materialized as a Python string:
+    64 KiB chunks are written straight from the HTTP stream to the target file
+    in binary mode, keeping peak memory flat for multi-MB records.
+
+    With compress=True the chunks pass through a zstd level-3 stream writer,
+    which compresses FASTA/GenBank text roughly 4x at near-memory bandwidth,
+    so the (usually I/O-bound) save writes far fewer bytes.
+
+    Args:
+        ids: List of unique identifiers for the records to fetch
+        db: The target NCBI Entrez database
+        reftype: The desired format for the downloaded data ("fasta" or "gb")
+        file_path: Destination file
+        compress: Compress the output with zstd while streaming
+
+    Returns:
+        int: Number of uncompressed payload bytes received
+
+    Raises:
+        HTTPError: If NCBI returns an error
+        ValueError: If ENTREZ_EMAIL is not configured, or compression is
+            requested without the zstandard package installed
+    """
+    email = ENTREZ_EMAIL or os.getenv("ENTREZ_EMAIL")
+    if not email:
+        raise ValueError("ENTREZ_EMAIL environment variable must be set for NCBI Entrez queries")
+    if compress and zstandard is None:
+        raise ValueError("Compressed Entrez downloads require the 'zstandard' package")
+
+    chunks = [ids[i:i + ENTREZ_BATCH_SIZE] for i in range(0, len(ids), ENTREZ_BATCH_SIZE)]
+    bytes_written = 0
+    with open(file_path, 'wb') as raw:
+        sink = zstandard.ZstdCompressor(level=3).stream_writer(raw) if compress else contextlib.nullcontext(raw)
+        with sink as f:
+            for chunk_ids in chunks:
+                with _entrez_semaphore:
+                    with _SESSION.get(EUTILS_EFETCH_URL, params=_entrez_params(chunk_ids, db, reftype, email), stream=True, timeout=60) as response:
+                        if response.status_code >= 400:
+                            raise HTTPError(response.url, response.status_code, response.reason, response.headers, None)
+                        for data_chunk in response.iter_content(65536):
+                            f.write(data_chunk)
+                            bytes_written += len(data_chunk)
+    return bytes_written
+
+
+@functools.lru_cache(maxsize=ENTREZ_CACHE_SIZE)
+def _get_entrez_cached(ids_key: tuple, db: DB_LITERAL, reftype: Literal["fasta", "gb"], batch_size: int = ENTREZ_BATCH_SIZE, max_workers: int = ENTREZ_MAX_WORKERS) -> str:
+    """In-process LRU cache over the raw Entrez fetch, keyed by (ids, db, reftype).
+
+    max_workers only shapes how a miss is fetched, but lru_cache keys every
+    argument; callers vary it rarely enough that the duplicate-entry risk is
+    not worth a custom cache.
+    """
+    return _get_entrez_disk(list(ids_key), db, reftype, batch_size, max_workers)
+
+
+def _get_entrez_disk(ids: List[str], db: DB_LITERAL, reftype: Literal["fasta", "gb"], batch_size: int = ENTREZ_BATCH_SIZE, max_workers: int = ENTREZ_MAX_WORKERS) -> str:
+    """On-disk cache layer below the LRU; a no-op passthrough when disabled."""
+    if _disk_cache is None:
+        return _get_entrez_uncached(ids, db, reftype, max_workers, batch_size)
+    cache_key = f"entrez:{db}:{reftype}:{','.join(ids)}"
+    cached = _disk_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    data = _get_entrez_uncached(ids, db, reftype, max_workers, batch_size)
+    _disk_cache.set(cache_key, data, expire=ENTREZ_DISK_TTL)
+    return data
+
+
+def clear_entrez_cache() -> None:
+    """Clears the in-process Entrez response cache (mainly useful for debugging)."""
+    _get_entrez_cached.cache_clear()
+
+
+def get_entrez(ids: List[str], db: DB_LITERAL, reftype: Literal["fasta", "gb"], max_workers: int = ENTREZ_MAX_WORKERS, batch_size: int = ENTREZ_BATCH_SIZE, no_cache: bool = False) -> str:
+    """
+    Downloads data from NCBI Entrez databases, caching responses.
+
+    Responses are cached in-process (LRU, ENTREZ_CACHE_SIZE entries) since Entrez
+    records are immutable per accession.version. When REDIS_URL is configured and
+    the redis package is installed, results are additionally shared across
+    processes with a one-day TTL.
+
+    Args:
+        ids: List of unique identifiers for the records to fetch
+        db: The target NCBI Entrez database
+        reftype: The desired format for the downloaded data ("fasta" or "gb")
+        max_workers: Maximum number of concurrent Entrez requests on a cache miss
+        batch_size: Number of IDs coalesced into each efetch round trip
+        no_cache: Bypass every cache layer and force a fresh fetch
+
+    Returns:
+        str: The downloaded data as a string
+
+    Raises:
+        HTTPError: If NCBI returns an error
+        Exception: For other unexpected errors
+    """
+    if no_cache:
+        return _get_entrez_uncached(ids, db, reftype, max_workers, batch_size)
+
+    if _redis_client is not None:
+        cache_key = f"entrez:{db}:{reftype}:{','.join(ids)}"
+        cached = _redis_client.get(cache_key)
+        if cached is not None:
+            return cached.decode("utf-8")
+        data = _get_entrez_uncached(ids, db, reftype, max_workers, batch_size)
+        _redis_client.setex(cache_key, ENTREZ_REDIS_TTL, data)
+        return data
+
+    return _get_entrez_cached(tuple(ids), db, reftype, batch_size, max_workers)
+
+
+def _get_entrez_uncached(ids: List[str], db: DB_LITERAL, reftype: Literal["fasta", "gb"], max_workers: int = ENTREZ_MAX_WORKERS, batch_size: int = ENTREZ_BATCH_SIZE) -> str:
     """
     Downloads data from NCBI Entrez databases.
 
-    This function uses Bio.Entrez to fetch data based on a list of IDs from a specified database.
-    
+    This function hits the Entrez efetch endpoint through a persistent HTTP session
+    (connection keep-alive plus automatic retry with backoff on transient errors).
+    Large ID lists are split into chunks of ENTREZ_BATCH_SIZE and fetched concurrently in a
+    thread pool (network round-trips overlap), with results concatenated in input order.
+
     Args:
         ids: List of unique identifiers for the records to fetch
         db: The target NCBI Entrez database
         reftype: The desired format for the downloaded data ("fasta" or "gb")
-        
+        max_workers: Maximum number of concurrent Entrez requests
+        batch_size: Number of IDs coalesced into each efetch round trip
+
     Returns:
         str: The downloaded data as a string
-        
+
     Raises:
         HTTPError: If NCBI returns an error
         Exception: For other unexpected errors
     """
     # Ensure ENTREZ_EMAIL is set
-    email = os.getenv("ENTREZ_EMAIL")
+    email = ENTREZ_EMAIL or os.getenv("ENTREZ_EMAIL")
     if not email:
         raise ValueError("ENTREZ_EMAIL environment variable must be set for NCBI Entrez queries")
-    
-    Entrez.email = email
-    
+
+    chunks = [ids[i:i + batch_size] for i in range(0, len(ids), batch_size)]
+    if len(chunks) <= 1:
+        return _fetch_entrez_chunk(ids, db, reftype, email)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+        # executor.map preserves submission order, so the concatenation
+        # matches the order of the input IDs.
+        results = executor.map(lambda chunk: _fetch_entrez_chunk(chunk, db, reftype, email), chunks)
+        return "".join(results)
+
+
+def _align_parasail(seq1: str, seq2: str, request: PairwiseAlignmentRequest) -> PairwiseAlignmentResponse:
+    """Run the alignment through parasail's striped SIMD Smith-Waterman/Needleman-Wunsch."""
+    matrix = parasail.matrix_create(
+        "ACGTN",
+        int(round(request.match_score)),
+        int(round(request.mismatch_penalty)),
+    )
+    align_fn = parasail.sw_trace_striped_16 if request.mode == "local" else parasail.nw_trace_striped_16
+    # parasail expects gap penalties as positive costs
+    result = align_fn(
+        seq1,
+        seq2,
+        int(round(-request.open_gap_penalty)),
+        int(round(-request.extend_gap_penalty)),
+        matrix,
+    )
+    traceback = result.traceback
+    full_alignment_str = f"{traceback.query}\n{traceback.comp}\n{traceback.ref}\n"
+    return PairwiseAlignmentResponse.model_construct(
+        score=float(result.score),
+        aligned_sequence1=traceback.query,
+        aligned_sequence2=traceback.ref,
+        full_alignment_str=full_alignment_str,
+        parameters_used=request.model_dump(exclude={"sequence1", "sequence2"}),
+    )
+
+
+def _comp_line(aligned1: str, aligned2: str) -> str:
+    """Build the middle comparison line of an alignment block ('|' match, '.' mismatch, ' ' gap)."""
+    return "".join(
+        "|" if x == y else " " if x == "-" or y == "-" else "."
+        for x, y in zip(aligned1, aligned2)
+    )
+
+
+def _align_gpu(seq1_bytes: bytes, seq2_bytes: bytes, request: PairwiseAlignmentRequest) -> PairwiseAlignmentResponse:
+    """Run the alignment through the cupy wavefront kernel."""
+    score, aligned1, aligned2 = gotoh_align_gpu(
+        seq1_bytes,
+        seq2_bytes,
+        request.match_score,
+        request.mismatch_penalty,
+        request.open_gap_penalty,
+        request.extend_gap_penalty,
+        request.mode,
+    )
+    full_alignment_str = f"{aligned1}\n{_comp_line(aligned1, aligned2)}\n{aligned2}\n"
+    return PairwiseAlignmentResponse.model_construct(
+        score=score,
+        aligned_sequence1=aligned1,
+        aligned_sequence2=aligned2,
+        full_alignment_str=full_alignment_str,
+        parameters_used=request.model_dump(exclude={"sequence1", "sequence2"}),
+    )
+
+
+def _align_numba(seq1_bytes: bytes, seq2_bytes: bytes, request: PairwiseAlignmentRequest) -> PairwiseAlignmentResponse:
+    """Run the alignment through the numba-compiled Gotoh affine-gap kernel."""
+    score, aligned1, aligned2 = gotoh_align(
+        seq1_bytes,
+        seq2_bytes,
+        request.match_score,
+        request.mismatch_penalty,
+        request.open_gap_penalty,
+        request.extend_gap_penalty,
+        request.mode,
+    )
+    full_alignment_str = f"{aligned1}\n{_comp_line(aligned1, aligned2)}\n{aligned2}\n"
+    return PairwiseAlignmentResponse.model_construct(
+        score=score,
+        aligned_sequence1=aligned1,
+        aligned_sequence2=aligned2,
+        full_alignment_str=full_alignment_str,
+        parameters_used=request.model_dump(exclude={"sequence1", "sequence2"}),
+    )
+
+
+# PairwiseAligner instances are not thread-safe, so the per-configuration
+# cache is thread-local; handlers run alignments in worker threads.
+_aligner_local = threading.local()
+_ALIGNER_CACHE_SIZE = 32
+
+
+def _get_aligner(match_score: float, mismatch_penalty: float, open_gap_penalty: float,
+                 extend_gap_penalty: float, mode: str) -> Align.PairwiseAligner:
+    """Return a configured PairwiseAligner, cached per thread and scoring scheme."""
+    cache = getattr(_aligner_local, "cache", None)
+    if cache is None:
+        cache = _aligner_local.cache = {}
+    key = (match_score, mismatch_penalty, open_gap_penalty, extend_gap_penalty, mode)
+    aligner = cache.get(key)
+    if aligner is None:
+        aligner = Align.PairwiseAligner()
+        aligner.mode = mode
+        aligner.match_score = match_score
+        aligner.mismatch_score = mismatch_penalty
+        aligner.open_gap_score = open_gap_penalty
+        aligner.extend_gap_score = extend_gap_penalty
+        if len(cache) >= _ALIGNER_CACHE_SIZE:
+            cache.clear()
+        cache[key] = aligner
+    return aligner
+
+
+def _align_biopython(seq1: str, seq2: str, request: PairwiseAlignmentRequest) -> PairwiseAlignmentResponse:
+    """Run the alignment through Biopython's PairwiseAligner (general-alphabet fallback)."""
+    aligner = _get_aligner(
+        request.match_score,
+        request.mismatch_penalty,
+        request.open_gap_penalty,
+        request.extend_gap_penalty,
+        request.mode,
+    )
+
+    # PairwiseAlignments is a lazy iterator over co-optimal alignments, whose
+    # count can be astronomically large for repetitive inputs; pull only the
+    # first (best) one instead of enumerating them.
     try:
-        # Fetch the data
-        handle = Entrez.efetch(db=db, id=ids, rettype=reftype, retmode="text")
-        data = handle.read()
-        handle.close()
-        return data
-    except HTTPError as he:
-        # Re-raise HTTPError to be caught by the calling function
-        raise he
-    except Exception as e:
-        # Re-raise other exceptions
-        raise e
+        best_alignment = next(iter(aligner.align(seq1, seq2)))
+    except StopIteration:
+        raise ValueError("No alignment could be produced for the given sequences")
+    return PairwiseAlignmentResponse.model_construct(
+        score=float(best_alignment.score),
+        aligned_sequence1=str(best_alignment[0]),
+        aligned_sequence2=str(best_alignment[1]),
+        full_alignment_str=str(best_alignment),
+        parameters_used=request.model_dump(exclude={"sequence1", "sequence2"}),
+    )
+
+
+def run_pairwise_alignment(request: PairwiseAlignmentRequest) -> PairwiseAlignmentResponse:
+    """
+    Performs a pairwise sequence alignment.
+
+    Uses parasail's SSE/AVX2 striped Smith-Waterman / Needleman-Wunsch implementation
+    for nucleotide sequences when available, then a numba-compiled Gotoh affine-gap
+    kernel for any ASCII alphabet, and finally Biopython's PairwiseAligner when
+    neither accelerated backend is installed.
+
+    Args:
+        request: Alignment request with sequences, mode, and scoring parameters
+
+    Returns:
+        PairwiseAlignmentResponse: The best alignment with score and aligned sequences
+
+    Raises:
+        ValueError: If either sequence is empty
+    """
+    if not request.sequence1 or not request.sequence2:
+        raise ValueError("Both sequences must be non-empty for pairwise alignment")
+
+    # Encode and upper-case once at C speed; the DP backends then work on
+    # contiguous uint8 buffers (or strings derived from them) without
+    # per-character Python-object traffic.
+    seq1_bytes = request.sequence1.encode("ascii").upper()
+    seq2_bytes = request.sequence2.encode("ascii").upper()
+
+    # Agents often align a sequence against itself as a sanity check; identical
+    # inputs have a trivially perfect alignment, so skip the O(n*m) DP entirely.
+    # bytes equality is a length check plus memcmp, cheaper than any hashing.
+    if seq1_bytes == seq2_bytes:
+        s = seq1_bytes.decode("ascii")
+        return PairwiseAlignmentResponse.model_construct(
+            score=len(s) * request.match_score,
+            aligned_sequence1=s,
+            aligned_sequence2=s,
+            full_alignment_str=f"{s}\n{'|' * len(s)}\n{s}\n",
+            parameters_used=request.model_dump(exclude={"sequence1", "sequence2"}),
+        )
+
+    cells = len(seq1_bytes) * len(seq2_bytes)
+    want_gpu = request.accelerator == "gpu" or (
+        request.accelerator == "auto" and CUDA_AVAILABLE and cells > _GPU_MIN_CELLS
+    )
+    if want_gpu and CUDA_AVAILABLE and cells <= MAX_GPU_CELLS:
+        return _align_gpu(seq1_bytes, seq2_bytes, request)
+    # accelerator="gpu" forces the backend, so failing to use it is an error;
+    # only "auto" requests may silently degrade to the CPU backends.
+    if request.accelerator == "gpu":
+        if not CUDA_AVAILABLE:
+            raise ValueError("GPU alignment requested but no CUDA device is available")
+        raise ValueError(
+            f"GPU alignment requested but the problem size ({cells} DP cells) "
+            f"exceeds the GPU memory budget ({MAX_GPU_CELLS} cells)"
+        )
+
+    if (
+        parasail is not None
+        and _integral_scores(request.match_score, request.mismatch_penalty,
+                             request.open_gap_penalty, request.extend_gap_penalty)
+        and set(seq1_bytes) <= _PARASAIL_ALPHABET
+        and set(seq2_bytes) <= _PARASAIL_ALPHABET
+    ):
+        return _align_parasail(seq1_bytes.decode("ascii"), seq2_bytes.decode("ascii"), request)
+    if NUMBA_AVAILABLE:
+        return _align_numba(seq1_bytes, seq2_bytes, request)
+    return _align_biopython(seq1_bytes.decode("ascii"), seq2_bytes.decode("ascii"), request)
+
+
+def run_pairwise_alignment_many(
+    sequence1: str,
+    sequences2: List[str],
+    mode: Literal["global", "local"] = "global",
+    match_score: float = 2.0,
+    mismatch_penalty: float = -1.0,
+    open_gap_penalty: float = -10.0,
+    extend_gap_penalty: float = -0.5
+) -> List["PairwiseAlignmentResponse"]:
+    """
+    Aligns one query sequence against many target sequences.
+
+    When parasail handles the alphabet, the query profile is built once with
+    parasail.profile_create_16 and reused across all targets, and the targets
+    are aligned in a small thread pool (parasail releases the GIL in its C
+    code). Otherwise each pair falls back to run_pairwise_alignment.
+
+    Args:
+        sequence1: The query sequence aligned against every target
+        sequences2: The target sequences
+        mode: Alignment mode ("global" or "local")
+        match_score: Score for matching characters
+        mismatch_penalty: Penalty for mismatching characters (negative)
+        open_gap_penalty: Penalty for opening a gap (negative)
+        extend_gap_penalty: Penalty for extending a gap (negative)
+
+    Returns:
+        List[PairwiseAlignmentResponse]: One alignment per target, in input order
+
+    Raises:
+        ValueError: If the query or any target sequence is empty
+    """
+    if not sequence1 or not sequences2 or any(not s for s in sequences2):
+        raise ValueError("Query and all target sequences must be non-empty for pairwise alignment")
+
+    seq1 = sequence1.upper()
+    targets = [s.upper() for s in sequences2]
+    parameters_used = {
+        "mode": mode,
+        "match_score": match_score,
+        "mismatch_penalty": mismatch_penalty,
+        "open_gap_penalty": open_gap_penalty,
+        "extend_gap_penalty": extend_gap_penalty,
+    }
+
+    parasail_ok = (
+        parasail is not None
+        and _integral_scores(match_score, mismatch_penalty, open_gap_penalty, extend_gap_penalty)
+        and set(seq1.encode("ascii")) <= _PARASAIL_ALPHABET
+        and all(set(t.encode("ascii")) <= _PARASAIL_ALPHABET for t in targets)
+    )
+    if parasail_ok:
+        matrix = parasail.matrix_create("ACGTN", int(round(match_score)), int(round(mismatch_penalty)))
+        profile = parasail.profile_create_16(seq1, matrix)
+        align_fn = (
+            parasail.sw_trace_striped_profile_16 if mode == "local"
+            else parasail.nw_trace_striped_profile_16
+        )
+        open_penalty = int(round(-open_gap_penalty))
+        extend_penalty = int(round(-extend_gap_penalty))
+
+        def align_target(target: str) -> PairwiseAlignmentResponse:
+            result = align_fn(profile, target, open_penalty, extend_penalty)
+            traceback = result.traceback
+            return PairwiseAlignmentResponse.model_construct(
+                score=float(result.score),
+                aligned_sequence1=traceback.query,
+                aligned_sequence2=traceback.ref,
+                full_alignment_str=f"{traceback.query}\n{traceback.comp}\n{traceback.ref}\n",
+                parameters_used=parameters_used,
+            )
+
+        with ThreadPoolExecutor(max_workers=min(4, len(targets))) as executor:
+            return list(executor.map(align_target, targets))
+
+    def align_one(target: str) -> PairwiseAlignmentResponse:
+        return run_pairwise_alignment(PairwiseAlignmentRequest.model_construct(
+            sequence1=seq1,
+            sequence2=target,
+            mode=mode,
+            match_score=match_score,
+            mismatch_penalty=mismatch_penalty,
+            open_gap_penalty=open_gap_penalty,
+            extend_gap_penalty=extend_gap_penalty,
+        ))
+
+    # The numba kernels are compiled nogil, so alignments genuinely overlap
+    # across threads; without numba the Biopython fallback holds the GIL and
+    # threading would only add overhead.
+    if NUMBA_AVAILABLE and len(targets) > 1:
+        with ThreadPoolExecutor(max_workers=min(4, len(targets))) as executor:
+            return list(executor.map(align_one, targets))
+    return [align_one(target) for target in targets]
 
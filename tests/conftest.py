@@ -0,0 +1,122 @@
+import asyncio
+import os
+from pathlib import Path
+
+import pytest
+
+from biothings_mcp.server import BiothingsMCP
+
+# Resolved once at import: the project root lookup stats every path
+# component, so it has no business running inside fixtures.
+LOG_DIR = Path(__file__).resolve().parent.parent / "logs"
+
+
+# Shared across test modules so the combined run builds one server instead
+# of one per file. Server construction registers every tool and compiles
+# their Pydantic schemas. Modules that need a custom server (e.g. the
+# download suite's output_dir) shadow this with a local fixture.
+@pytest.fixture(scope="session")
+def mcp_server() -> BiothingsMCP:
+    """Fixture providing a BiothingsMCP server instance for testing."""
+    return BiothingsMCP()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _test_logging():
+    """Opt-in eliot log rendering for test runs.
+
+    Set BIOTHINGS_TEST_LOGS=1 to mirror the server's to_nice_stdout /
+    to_nice_file setup. Configured once per session so handlers are never
+    re-registered, and skipped entirely by default: rendering structured
+    records for every request is pure overhead when nobody reads them.
+    """
+    if os.getenv("BIOTHINGS_TEST_LOGS"):
+        from pycomfort.logging import to_nice_stdout, to_nice_file
+
+        LOG_DIR.mkdir(parents=True, exist_ok=True)
+        # Under pytest-xdist every worker runs this fixture; suffix the file
+        # names with the worker id so workers do not write to the same files.
+        worker = os.getenv("PYTEST_XDIST_WORKER")
+        stem = f"tests.{worker}" if worker else "tests"
+        to_nice_stdout()
+        to_nice_file(
+            output_file=LOG_DIR / f"{stem}.log.json",
+            rendered_file=LOG_DIR / f"{stem}.log",
+        )
+    yield
+
+
+@pytest.fixture(scope="session")
+def vcr_config(pytestconfig):
+    """pytest-recording settings for the network-bound suites.
+
+    Tests marked with @pytest.mark.vcr replay recorded upstream responses
+    from tests/cassettes/ instead of hitting mygene/myvariant, turning
+    reruns into local file reads. Cassettes are recorded on first run and
+    kept local (tests/cassettes/ is gitignored), so replay speeds up
+    reruns on one machine; fresh checkouts pay the network cost once.
+    `pytest --record-mode=none` replays strictly against existing local
+    cassettes, and `pytest --live` re-records them against the real
+    services.
+    """
+    if pytestconfig.getoption("--live"):
+        record_mode = "all"
+    else:
+        record_mode = os.getenv("BIOTHINGS_VCR_MODE", "new_episodes")
+    return {
+        "record_mode": record_mode,
+        "filter_headers": ["authorization", "user-agent"],
+        "decode_compressed_response": True,
+    }
+
+
+@pytest.hookimpl(hookwrapper=True, tryfirst=True)
+def pytest_runtest_protocol_async_group(group, nextgroup):
+    """Give each asyncio_concurrent group a usable event loop.
+
+    pytest-asyncio closes the current loop after its tests, and
+    pytest-asyncio-concurrent resolves the group loop with
+    asyncio.get_event_loop(), which then raises "no current event loop"
+    and aborts the whole run whenever a concurrent group follows a plain
+    pytest-asyncio test (or shares an xdist worker with one). Installing
+    a fresh loop when none is available keeps the mixed suite runnable.
+    """
+    try:
+        loop = asyncio.get_event_loop_policy().get_event_loop()
+        if loop.is_closed():
+            raise RuntimeError
+    except RuntimeError:
+        asyncio.set_event_loop(asyncio.new_event_loop())
+    yield
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--live",
+        action="store_true",
+        default=False,
+        help="Re-record cassettes against the live biothings services",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "entrez: test hits NCBI Entrez and requires ENTREZ_EMAIL to be set"
+    )
+    config.addinivalue_line(
+        "markers", "network: test talks to the public biothings services"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip Entrez-backed tests once at collection when ENTREZ_EMAIL is unset.
+
+    Replaces per-test env checks and makes `-m "not entrez"` a cheap way to
+    run only the offline part of the suite.
+    """
+    if os.getenv("ENTREZ_EMAIL"):
+        return
+    skip_entrez = pytest.mark.skip(reason="ENTREZ_EMAIL environment variable not set")
+    for item in items:
+        if "entrez" in item.keywords:
+            item.add_marker(skip_entrez)
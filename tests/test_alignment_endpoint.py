@@ -0,0 +1,158 @@
+import pytest
+import tempfile
+from pathlib import Path
+from typing import Generator
+from biothings_mcp.server import BiothingsMCP
+from biothings_mcp.download_api import (
+    DownloadTools,
+    PairwiseAlignmentRequest,
+    run_pairwise_alignment,
+    run_pairwise_alignment_many,
+)
+
+@pytest.fixture
+def temp_output_dir() -> Generator[str, None, None]:
+    """Fixture providing a temporary output directory for testing."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield temp_dir
+
+@pytest.fixture
+def mcp_server(temp_output_dir: str) -> BiothingsMCP:
+    """Fixture providing a BiothingsMCP server instance for testing."""
+    return BiothingsMCP(output_dir=temp_output_dir)
+
+@pytest.fixture
+def download_tools(mcp_server: BiothingsMCP) -> DownloadTools:
+    """Fixture providing DownloadTools instance for testing."""
+    return DownloadTools(mcp_server, prefix="test_", output_dir=mcp_server.output_dir)
+
+def test_pairwise_alignment_global_identical() -> None:
+    """Test global alignment of two identical sequences.
+
+    This test verifies that a global alignment of identical sequences
+    produces a perfect alignment: the score equals length * match_score
+    and both aligned sequences are gap-free.
+    """
+    sequence = "ACGTACGT"
+    request = PairwiseAlignmentRequest(sequence1=sequence, sequence2=sequence)
+    response = run_pairwise_alignment(request)
+
+    assert response.score == len(sequence) * request.match_score
+    assert response.aligned_sequence1 == sequence
+    assert response.aligned_sequence2 == sequence
+    assert response.parameters_used["mode"] == "global"
+
+def test_pairwise_alignment_global_mismatch() -> None:
+    """Test global alignment with a single mismatch.
+
+    This test verifies that a single substitution is scored as
+    (length - 1) * match_score + mismatch_penalty and that no gaps
+    are introduced for a same-length substitution.
+    """
+    request = PairwiseAlignmentRequest(sequence1="ACGTACGT", sequence2="ACGTTCGT")
+    response = run_pairwise_alignment(request)
+
+    expected_score = 7 * request.match_score + request.mismatch_penalty
+    assert response.score == expected_score
+    assert "-" not in response.aligned_sequence1
+    assert "-" not in response.aligned_sequence2
+
+def test_pairwise_alignment_global_gap() -> None:
+    """Test global alignment requiring a gap.
+
+    This test verifies that aligning a sequence against a copy with a
+    deletion introduces a gap character in the shorter sequence.
+    """
+    request = PairwiseAlignmentRequest(sequence1="ACGTACGT", sequence2="ACGTCGT")
+    response = run_pairwise_alignment(request)
+
+    assert "-" in response.aligned_sequence2
+    assert response.aligned_sequence1.replace("-", "") == "ACGTACGT"
+    assert response.aligned_sequence2.replace("-", "") == "ACGTCGT"
+
+def test_pairwise_alignment_local_mode() -> None:
+    """Test local (Smith-Waterman) alignment.
+
+    This test verifies that local mode finds the best matching
+    subsequence and returns a positive score.
+    """
+    request = PairwiseAlignmentRequest(
+        sequence1="TTTTACGTACGTTTTT",
+        sequence2="ACGTACGT",
+        mode="local",
+    )
+    response = run_pairwise_alignment(request)
+
+    assert response.score == 8 * request.match_score
+    assert "ACGTACGT" in response.aligned_sequence1
+
+def test_pairwise_alignment_protein_fallback() -> None:
+    """Test alignment of protein sequences.
+
+    Protein sequences are outside the nucleotide alphabet and exercise
+    the numba/Biopython fallback path. The sequences differ by one
+    substitution so the identical-sequence short-circuit does not apply
+    and the DP backend actually runs.
+    """
+    request = PairwiseAlignmentRequest(sequence1="MKTAYIAKQR", sequence2="MKTAYIVKQR")
+    response = run_pairwise_alignment(request)
+
+    expected_score = 9 * request.match_score + request.mismatch_penalty
+    assert response.score == expected_score
+    assert response.aligned_sequence1 == "MKTAYIAKQR"
+    assert response.aligned_sequence2 == "MKTAYIVKQR"
+
+def test_pairwise_alignment_many() -> None:
+    """Test aligning one query against multiple targets.
+
+    This test verifies that run_pairwise_alignment_many returns one
+    alignment per target in input order and that each result matches
+    the corresponding single-pair alignment score.
+    """
+    query = "ACGTACGT"
+    targets = ["ACGTACGT", "ACGTTCGT", "ACGTCGT"]
+    responses = run_pairwise_alignment_many(query, targets)
+
+    assert len(responses) == len(targets)
+    for target, response in zip(targets, responses):
+        single = run_pairwise_alignment(PairwiseAlignmentRequest(sequence1=query, sequence2=target))
+        assert response.score == single.score
+        assert response.aligned_sequence2.replace("-", "") == target
+
+def test_pairwise_alignment_empty_sequence() -> None:
+    """Test that empty sequences are rejected with a ValueError."""
+    request = PairwiseAlignmentRequest(sequence1="", sequence2="ACGT")
+    with pytest.raises(ValueError):
+        run_pairwise_alignment(request)
+
+def test_perform_pairwise_alignment_local_save_to_file(download_tools: DownloadTools) -> None:
+    """Test saving a pairwise alignment report to a local file.
+
+    This test verifies that an alignment report built from the alignment
+    response is correctly persisted via _save_to_local_file with the
+    'alignment' format.
+    """
+    request = PairwiseAlignmentRequest(sequence1="ACGTACGT", sequence2="ACGTTCGT")
+    alignment_result = run_pairwise_alignment(request)
+
+    alignment_content = (
+        f"Pairwise Alignment Result\n"
+        f"Mode: {alignment_result.parameters_used['mode']}\n"
+        f"Score: {alignment_result.score}\n\n"
+        f"{alignment_result.full_alignment_str}"
+    )
+    result = download_tools._save_to_local_file(
+        data=alignment_content,
+        format_type="alignment",
+        output_path=None,
+        default_prefix="pairwise_alignment"
+    )
+
+    assert result["success"] is True
+    assert result["format"] == "alignment"
+    file_path = Path(result["path"])
+    assert file_path.exists()
+    assert file_path.suffix == ".aln"
+    saved_content = file_path.read_text()
+    assert "Pairwise Alignment Result" in saved_content
+    assert alignment_result.aligned_sequence1 in saved_content
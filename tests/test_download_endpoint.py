@@ -1,28 +1,28 @@
 import pytest
-import os
-import tempfile
 from pathlib import Path
-from typing import Generator, Optional
 from biothings_mcp.server import BiothingsMCP
 from biothings_mcp.download_api import DownloadTools, get_entrez, LocalFileResult
 
-@pytest.fixture
-def temp_output_dir() -> Generator[str, None, None]:
+# Server construction registers every tool and compiles their Pydantic
+# schemas, so the instance is built once per session; per-test isolation
+# comes from the unique auto-generated filenames inside the output dir.
+@pytest.fixture(scope="session")
+def temp_output_dir(tmp_path_factory: pytest.TempPathFactory) -> str:
     """Fixture providing a temporary output directory for testing."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield temp_dir
+    return str(tmp_path_factory.mktemp("biothings_output"))
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mcp_server(temp_output_dir: str) -> BiothingsMCP:
     """Fixture providing a BiothingsMCP server instance for testing."""
     return BiothingsMCP(output_dir=temp_output_dir)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def download_tools(mcp_server: BiothingsMCP) -> DownloadTools:
     """Fixture providing DownloadTools instance for testing."""
     return DownloadTools(mcp_server, prefix="test_", output_dir=mcp_server.output_dir)
 
 @pytest.mark.asyncio
+@pytest.mark.entrez
 async def test_download_entrez_data_fasta(download_tools: DownloadTools) -> None:
     """Test the download_entrez_data MCP tool with FASTA format.
     
@@ -32,10 +32,6 @@ async def test_download_entrez_data_fasta(download_tools: DownloadTools) -> None
     
     Note: This test requires ENTREZ_EMAIL environment variable to be set.
     """
-    # Skip if no ENTREZ_EMAIL is set
-    if not os.getenv("ENTREZ_EMAIL"):
-        pytest.skip("ENTREZ_EMAIL environment variable not set")
-    
     # Test data
     ids = ["NM_000546.6"]  # Human TP53 mRNA
     db = "nucleotide"
@@ -51,6 +47,7 @@ async def test_download_entrez_data_fasta(download_tools: DownloadTools) -> None
     assert "NM_000546.6" in result
 
 @pytest.mark.asyncio
+@pytest.mark.entrez
 async def test_download_entrez_data_genbank(download_tools: DownloadTools) -> None:
     """Test the download_entrez_data MCP tool with GenBank format.
     
@@ -60,10 +57,6 @@ async def test_download_entrez_data_genbank(download_tools: DownloadTools) -> No
     
     Note: This test requires ENTREZ_EMAIL environment variable to be set.
     """
-    # Skip if no ENTREZ_EMAIL is set
-    if not os.getenv("ENTREZ_EMAIL"):
-        pytest.skip("ENTREZ_EMAIL environment variable not set")
-    
     # Test data
     ids = ["NM_000546.6"]  # Human TP53 mRNA
     db = "nucleotide"
@@ -79,6 +72,7 @@ async def test_download_entrez_data_genbank(download_tools: DownloadTools) -> No
     assert "NM_000546.6" in result
 
 @pytest.mark.asyncio
+@pytest.mark.entrez
 async def test_download_entrez_multiple_ids(download_tools: DownloadTools) -> None:
     """Test the download_entrez_data MCP tool with multiple IDs.
     
@@ -87,10 +81,6 @@ async def test_download_entrez_multiple_ids(download_tools: DownloadTools) -> No
     
     Note: This test requires ENTREZ_EMAIL environment variable to be set.
     """
-    # Skip if no ENTREZ_EMAIL is set
-    if not os.getenv("ENTREZ_EMAIL"):
-        pytest.skip("ENTREZ_EMAIL environment variable not set")
-    
     # Test data - multiple sequences
     ids = ["NM_000546.6", "NM_001126112.3"]  # Two different sequences
     db = "nucleotide"
@@ -108,6 +98,7 @@ async def test_download_entrez_multiple_ids(download_tools: DownloadTools) -> No
     assert result.count(">") >= 2
 
 @pytest.mark.asyncio
+@pytest.mark.entrez
 async def test_download_entrez_data_local_fasta(download_tools: DownloadTools) -> None:
     """Test the download_entrez_data_local MCP tool with FASTA format.
     
@@ -116,10 +107,6 @@ async def test_download_entrez_data_local_fasta(download_tools: DownloadTools) -
     
     Note: This test requires ENTREZ_EMAIL environment variable to be set.
     """
-    # Skip if no ENTREZ_EMAIL is set
-    if not os.getenv("ENTREZ_EMAIL"):
-        pytest.skip("ENTREZ_EMAIL environment variable not set")
-    
     # Test data
     ids = ["NM_000546.6"]  # Human TP53 mRNA
     db = "nucleotide"
@@ -154,6 +141,7 @@ async def test_download_entrez_data_local_fasta(download_tools: DownloadTools) -
     assert "NM_000546.6" in saved_content
 
 @pytest.mark.asyncio
+@pytest.mark.entrez
 async def test_download_entrez_data_local_genbank(download_tools: DownloadTools) -> None:
     """Test the download_entrez_data_local MCP tool with GenBank format.
     
@@ -162,10 +150,6 @@ async def test_download_entrez_data_local_genbank(download_tools: DownloadTools)
     
     Note: This test requires ENTREZ_EMAIL environment variable to be set.
     """
-    # Skip if no ENTREZ_EMAIL is set
-    if not os.getenv("ENTREZ_EMAIL"):
-        pytest.skip("ENTREZ_EMAIL environment variable not set")
-    
     # Test data
     ids = ["NM_000546.6"]  # Human TP53 mRNA
     db = "nucleotide"
@@ -200,6 +184,7 @@ async def test_download_entrez_data_local_genbank(download_tools: DownloadTools)
     assert "NM_000546.6" in saved_content
 
 @pytest.mark.asyncio
+@pytest.mark.entrez
 async def test_download_entrez_data_local_custom_path(download_tools: DownloadTools) -> None:
     """Test the download_entrez_data_local MCP tool with custom output path.
     
@@ -207,10 +192,6 @@ async def test_download_entrez_data_local_custom_path(download_tools: DownloadTo
     
     Note: This test requires ENTREZ_EMAIL environment variable to be set.
     """
-    # Skip if no ENTREZ_EMAIL is set
-    if not os.getenv("ENTREZ_EMAIL"):
-        pytest.skip("ENTREZ_EMAIL environment variable not set")
-    
     # Test data
     ids = ["NM_000546.6"]  # Human TP53 mRNA
     db = "nucleotide"